@@ -0,0 +1,126 @@
+import numpy as np
+from manim import *
+
+from animtools import graphs
+from spectra import wien_displacement
+
+# Rows of the radiance table, in Kelvin. Linear interpolation between rows
+# 25 K apart is off by about 1e-3 kW⋅sr⁻¹⋅m⁻³ on the Introduction axes.
+TEMPERATURE_STEP = 25
+
+
+def radiance_table(function, wavelengths, temperatures):
+    """
+    Spectral radiance on a temperature × wavelength grid, in one call.
+
+    Parameters:
+    -----------
+    function : callable
+        function(wavelength, temperature), evaluated on broadcast arrays
+    wavelengths : array
+        Wavelength samples (columns)
+    temperatures : array
+        Temperatures in Kelvin (rows)
+
+    Returns:
+    --------
+    array : (len(temperatures), len(wavelengths)) radiance
+    """
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    temperatures = np.asarray(temperatures, dtype=float)
+    with np.errstate(all="ignore"):
+        return function(wavelengths[None, :], temperatures[:, None])
+
+
+class BlackbodyCurve(VMobject):
+    def __init__(
+        self,
+        axes,
+        temperature,
+        function,
+        t_range=(2000, 5500),
+        t_step=TEMPERATURE_STEP,
+        **kwargs,
+    ):
+        """
+        The radiance curve of a black body at the temperature `temperature`
+        holds, redrawn every frame without building a new graph.
+
+        The radiance is computed once on a temperature × wavelength grid and
+        turned into the Bezier points of the smooth graph of each row. As the
+        handles of a smooth curve are linear in its anchors, blending two rows
+        of points gives the same curve as plotting the blended radiance; each
+        frame only does that blend, into the points array already there.
+
+        Parameters:
+        -----------
+        axes : Axes
+            Axes to plot on, with the wavelength in nm on x
+        temperature : ValueTracker
+            Temperature in Kelvin, kept within `t_range`
+        function : callable
+            function(wavelength_nm, temperature) on arrays, e.g.
+            `planck_function_nm`
+        t_range : tuple
+            Lowest and highest temperature the curve can show
+        t_step : float
+            Temperature step between rows of the table
+        """
+        super().__init__(**kwargs)
+        self.axes = axes
+        self.temperature = temperature
+        self.function = function
+
+        self.temperatures = np.arange(t_range[0], t_range[1] + t_step, t_step)
+        self.temperatures[-1] = t_range[1]
+        self.wavelengths = graphs.sample_range(axes)
+        self.radiance = radiance_table(function, self.wavelengths, self.temperatures)
+
+        # Bezier points of each row
+        row = VMobject()
+        rows = []
+        for radiance in self.radiance:
+            row.set_points_smoothly(
+                graphs.coords_to_points(axes, self.wavelengths, radiance)
+            )
+            rows.append(row.points.copy())
+        self.point_table = np.array(rows)
+        self._blend = np.empty_like(self.point_table[0])
+
+        self.set_points(self.point_table[0].copy())
+        self.add_updater(lambda m: m.set_temperature(m.temperature.get_value()))
+        self.set_temperature(temperature.get_value())
+
+    def get_row(self, temperature):
+        """Lower table row around `temperature`, and the weight of the next."""
+        temperatures = self.temperatures
+        temperature = min(max(temperature, temperatures[0]), temperatures[-1])
+        index = min(
+            int((temperature - temperatures[0]) // (temperatures[1] - temperatures[0])),
+            len(temperatures) - 2,
+        )
+        weight = (temperature - temperatures[index]) / (
+            temperatures[index + 1] - temperatures[index]
+        )
+        return index, weight
+
+    def set_temperature(self, temperature):
+        index, weight = self.get_row(temperature)
+        if self.points.shape != self._blend.shape:
+            self.points = np.empty_like(self._blend)
+        np.multiply(self.point_table[index], 1 - weight, out=self.points)
+        np.multiply(self.point_table[index + 1], weight, out=self._blend)
+        self.points += self._blend
+        return self
+
+    def peak_point(self):
+        """Where the curve peaks, by Wien's displacement law."""
+        temperature = self.temperature.get_value()
+        peak_nm = wien_displacement(temperature) / 1e-9
+        return self.axes.c2p(peak_nm, self.function(peak_nm, temperature))
+
+    def get_peak_dot(self, **kwargs):
+        """A Dot that stays on the peak as the temperature changes."""
+        dot = Dot(self.peak_point(), **kwargs)
+        dot.add_updater(lambda d: d.move_to(self.peak_point()))
+        return dot
@@ -0,0 +1,143 @@
+"""
+The color of a black body at a given temperature.
+
+The Planck spectrum is integrated against the CIE 1931 color matching
+functions (the analytic multi-lobe fits of Wyman, Sloan and Shirley, 2013),
+converted from XYZ to sRGB and scaled to full brightness. That is done once,
+for every `T_STEP` Kelvin from `T_MIN` to `T_MAX`, and the table is saved
+under the media directory, keyed by a hash of this file and `spectra`.
+`blackbody_color` then only interpolates between two rows, so it can run in
+an updater on every frame:
+
+    glow.add_updater(lambda m: m.set_color(blackbody_color(tracker.get_value())))
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+import spectra
+
+# Temperatures of the table, in Kelvin
+T_MIN = 500
+T_MAX = 30_000
+T_STEP = 10
+
+# Wavelengths the spectrum is integrated over, in nm
+WAVELENGTHS = np.arange(360, 831, 1.0)
+
+# (weight, mean, sigma below the mean, sigma above it) of each lobe
+CMF_LOBES = (
+    (
+        (1.056, 599.8, 37.9, 31.0),
+        (0.362, 442.0, 16.0, 26.7),
+        (-0.065, 501.1, 20.4, 26.2),
+    ),
+    ((0.821, 568.8, 46.9, 40.5), (0.286, 530.9, 16.3, 31.1)),
+    ((1.217, 437.0, 11.8, 36.0), (0.681, 459.0, 26.0, 13.8)),
+)
+
+# Linear sRGB from CIE XYZ (D65 white)
+XYZ_TO_SRGB = np.array(
+    [
+        [3.2406, -1.5372, -0.4986],
+        [-0.9689, 1.8758, 0.0415],
+        [0.0557, -0.2040, 1.0570],
+    ]
+)
+
+
+def color_matching_functions(wavelength_nm):
+    """
+    CIE 1931 x̄, ȳ, z̄ at `wavelength_nm`.
+
+    Parameters:
+    -----------
+    wavelength_nm : array
+        Wavelengths in nanometers
+
+    Returns:
+    --------
+    array : (len(wavelength_nm), 3)
+    """
+    wavelength_nm = np.asarray(wavelength_nm, dtype=float)[:, None]
+    columns = []
+    for lobes in CMF_LOBES:
+        weight, mean, below, above = np.array(lobes).T
+        sigma = np.where(wavelength_nm < mean, below, above)
+        columns.append(np.exp(-0.5 * ((wavelength_nm - mean) / sigma) ** 2) @ weight)
+    return np.stack(columns, axis=1)
+
+
+def blackbody_xyz(temperatures):
+    """CIE XYZ of black bodies at `temperatures`, one row each."""
+    temperatures = np.asarray(temperatures, dtype=float)[:, None]
+    radiance = spectra.planck_spectral_radiance(WAVELENGTHS * 1e-9, temperatures)
+    return radiance @ color_matching_functions(WAVELENGTHS)
+
+
+def xyz_to_rgb(xyz):
+    """
+    Gamma-encoded sRGB of `xyz`, at full brightness (largest channel 1).
+
+    Colors outside the sRGB gamut (the deep red of cool bodies) lose their
+    negative channel.
+    """
+    linear = np.clip(xyz @ XYZ_TO_SRGB.T, 0, None)
+    linear /= linear.max(axis=-1, keepdims=True)
+    return np.where(
+        linear <= 0.0031308,
+        12.92 * linear,
+        1.055 * linear ** (1 / 2.4) - 0.055,
+    )
+
+
+def _path():
+    from manim import config
+
+    key = hashlib.sha1()
+    for module in (__file__, spectra.__file__):
+        key.update(Path(module).read_bytes())
+    key = key.hexdigest()[:16]
+    return Path(config.media_dir) / "colors" / f"blackbody-{key}.npy"
+
+
+@lru_cache(maxsize=1)
+def rgb_table():
+    """sRGB of every `T_STEP` Kelvin from `T_MIN` to `T_MAX`, read-only."""
+    path = _path()
+    try:
+        table = np.load(path)
+    except (OSError, ValueError):
+        temperatures = np.arange(T_MIN, T_MAX + T_STEP, T_STEP)
+        table = xyz_to_rgb(blackbody_xyz(temperatures))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.npy")
+        np.save(tmp, table)
+        tmp.replace(path)
+    table.flags.writeable = False
+    return table
+
+
+def blackbody_rgb(temperature):
+    """
+    sRGB (0 to 1) of a black body at `temperature` Kelvin, interpolated from
+    `rgb_table`; clamped to the table's range.
+    """
+    table = rgb_table()
+    temperature = min(max(temperature, T_MIN), T_MAX)
+    position = (temperature - T_MIN) / T_STEP
+    index = min(int(position), len(table) - 2)
+    weight = position - index
+    return table[index] * (1 - weight) + table[index + 1] * weight
+
+
+def blackbody_color(temperature):
+    """`blackbody_rgb` as a ManimColor."""
+    from manim import ManimColor
+
+    return ManimColor(blackbody_rgb(temperature))
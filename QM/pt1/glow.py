@@ -0,0 +1,204 @@
+from functools import lru_cache
+
+import numpy as np
+from manim import *
+
+# The falloff `create_glow` used to build from 60 stacked Circles, in units
+# of the glow radius: layer i has radius 1.002^(i^2) / 400 and fill opacity
+# 0.2 - i / 300.
+LAYERS = np.arange(60)
+LAYER_RADII = 1.002 ** (LAYERS**2) / 400
+LAYER_OPACITIES = 0.2 - LAYERS / 300
+
+# How far the outermost layer reaches, in glow radii
+EXTENT = LAYER_RADII[-1]
+
+# The 50 Cubes of `create_square_glow`, in units of the cube's side: shell i
+# has side 1.01^i and fill opacity 0.006 - i / 10000. Seen face on, the front
+# and back faces of a shell cover the same square.
+SHELLS = np.arange(50)
+SHELL_HALF_SIDES = 1.01**SHELLS / 2
+SHELL_OPACITIES = 1 - (1 - (0.006 - SHELLS / 10_000)) ** 2
+
+SQUARE_EXTENT = SHELL_HALF_SIDES[-1]
+
+
+def stacked_opacity(distance, sizes, opacities):
+    """
+    Opacity of stacked same-colored layers at `distance` from the center.
+
+    A pixel is covered by every layer that reaches it, and the layers share
+    one color, so over-compositing them leaves that color with opacity
+    1 - prod(1 - opacity) over the covering layers.
+
+    Parameters:
+    -----------
+    distance : float or array
+        Distance from the center
+    sizes : array
+        How far each layer reaches, ascending
+    opacities : array
+        Opacity of each layer
+    """
+    # transmitted[k]: light let through by layers k and up
+    transmitted = np.append(np.cumprod((1 - opacities)[::-1])[::-1], 1.0)
+    return 1 - transmitted[np.searchsorted(sizes, distance)]
+
+
+def stacked_circles(distance):
+    """Falloff of the old `create_glow`, `distance` in glow radii."""
+    return stacked_opacity(distance, LAYER_RADII, LAYER_OPACITIES)
+
+
+def stacked_cubes(distance):
+    """Falloff of the old `create_square_glow`, `distance` in cube sides."""
+    return stacked_opacity(distance, SHELL_HALF_SIDES, SHELL_OPACITIES)
+
+
+@lru_cache(maxsize=32)
+def glow_texture(
+    color, falloff=stacked_circles, resolution=512, extent=EXTENT, square=False
+):
+    """
+    RGBA texture of a glow reaching `extent` (in the units `falloff` takes)
+    from the center to the edge.
+
+    Parameters:
+    -----------
+    color : str
+        Hex color of the glow
+    falloff : callable
+        Opacity as a function of the distance from the center, evaluated on
+        arrays
+    resolution : int
+        Width and height of the texture in pixels
+    square : bool
+        Measure the distance to the center along the axes (max(|x|, |y|))
+        instead of radially, for square glows
+
+    Returns:
+    --------
+    np.ndarray
+        Read-only (resolution, resolution, 4) uint8 array
+    """
+    # Pixel centers, in falloff units
+    coords = ((np.arange(resolution) + 0.5) / resolution * 2 - 1) * extent
+    if square:
+        distance = np.maximum(np.abs(coords[:, None]), np.abs(coords[None, :]))
+    else:
+        distance = np.hypot(coords[:, None], coords[None, :])
+
+    texture = np.empty((resolution, resolution, 4), dtype=np.uint8)
+    texture[..., :3] = np.round(ManimColor(color).to_rgb() * 255)
+    texture[..., 3] = np.round(np.clip(falloff(distance), 0, 1) * 255)
+    texture.flags.writeable = False
+    return texture
+
+
+class Glow(ImageMobject):
+    def __init__(
+        self,
+        radius=1,
+        color=YELLOW,
+        falloff=stacked_circles,
+        resolution=512,
+        extent=EXTENT,
+        **kwargs,
+    ):
+        """
+        A radial glow drawn from one precomputed texture.
+
+        It costs the same to draw however smooth the falloff is, and it is a
+        single mobject: `move_to`, `scale` and `set_color` (which repaints the
+        texture's RGB and keeps its falloff) work as usual.
+
+        Parameters:
+        -----------
+        radius : float
+            Glow radius; the default falloff reaches about 2.6 times as far
+        color : Color
+            Color of the glow
+        falloff : callable
+            Opacity as a function of the distance from the center, in radii
+        resolution : int
+            Texture size in pixels
+        extent : float
+            How many radii the texture covers from its center to its edge
+        """
+        texture = glow_texture(ManimColor(color).to_hex(), falloff, resolution, extent)
+        # Our own copy: set_color writes into the pixel array
+        super().__init__(np.array(texture), **kwargs)
+        self.scale_to_fit_height(2 * extent * radius)
+        self.glow_radius = radius
+
+
+class SquareGlow(ImageMobject):
+    def __init__(
+        self,
+        length=1,
+        color=YELLOW,
+        falloff=stacked_cubes,
+        resolution=512,
+        extent=SQUARE_EXTENT,
+        **kwargs,
+    ):
+        """
+        A square glow for 3D scenes, drawn as one textured sprite.
+
+        Stands in for stacked translucent cubes around a cube of side
+        `length`: the texture holds what those shells look like face on, so
+        drawing it costs one image however many shells it replaces. Register
+        it with `ThreeDScene.add_fixed_orientation_mobjects` to keep it facing
+        the camera when the scene moves in 3D.
+
+        Parameters:
+        -----------
+        length : float
+            Side of the cube the glow surrounds
+        color : Color
+            Color of the glow
+        falloff : callable
+            Opacity as a function of the distance from the center along the
+            axes, in cube sides
+        resolution : int
+            Texture size in pixels
+        extent : float
+            How many cube sides the texture covers from its center to its edge
+        """
+        texture = glow_texture(
+            ManimColor(color).to_hex(), falloff, resolution, extent, square=True
+        )
+        super().__init__(np.array(texture), **kwargs)
+        self.scale_to_fit_height(2 * extent * length)
+        self.glow_length = length
+
+
+if __name__ == "__main__":
+    # Benchmark: frames of the old 50-Cube glow vs SquareGlow, drawn by the
+    # 3D camera while the color changes as in the temperature sweep
+    import time
+
+    def cube_shells(length=2, color=YELLOW):
+        return VGroup(
+            *[
+                Cube(
+                    length * (1.01**idx),
+                    stroke_opacity=0,
+                    fill_color=color,
+                    fill_opacity=0.006 - idx / 10_000,
+                )
+                for idx in range(50)
+            ]
+        )
+
+    colors = [0xFF0017, 0xFF7C00, 0xCEB04D, 0x83B28D, 0x3DA8AD]
+    frames = 60
+    camera = ThreeDCamera()
+    for name, glow in (("50 Cubes", cube_shells()), ("SquareGlow", SquareGlow(2))):
+        start = time.perf_counter()
+        for frame in range(frames):
+            glow.set_color(ManimColor(colors[frame % len(colors)]))
+            camera.reset()
+            camera.capture_mobjects([glow])
+        elapsed = (time.perf_counter() - start) / frames
+        print(f"{name}: {elapsed * 1000:.1f} ms per frame")
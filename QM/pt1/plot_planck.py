@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from spectra import planck_spectral_radiance, radiance_grid, wien_displacement
+
 
 def plot_planck_law(
     temperatures=[3000, 4000, 5000, 6000],
@@ -24,43 +26,10 @@ def plot_planck_law(
     fig, ax : matplotlib figure and axes objects
     """
 
-    # Physical constants
-    h = 6.62607015e-34  # Planck constant (J⋅s)
-    c = 299792458  # Speed of light (m/s)
-    k_B = 1.380649e-23  # Boltzmann constant (J/K)
-
-    # Create wavelength array
-    wavelength = np.linspace(wavelength_range[0], wavelength_range[1], num_points)
-
-    def planck_spectral_radiance(wavelength, temperature):
-        """
-        Calculate spectral radiance using Planck's law.
-
-        B(λ,T) = (2hc²/λ⁵) × 1/(exp(hc/λkT) - 1)
-
-        Parameters:
-        -----------
-        wavelength : array
-            Wavelength in meters
-        temperature : float
-            Temperature in Kelvin
-
-        Returns:
-        --------
-        array : Spectral radiance in W⋅sr⁻¹⋅m⁻³
-        """
-        # Avoid division by zero and overflow
-        exponent = (h * c) / (wavelength * k_B * temperature)
-
-        # Use np.clip to avoid overflow in exponential
-        exponent = np.clip(exponent, 0, 700)  # e^700 is near float64 limit
-
-        numerator = 2 * h * c**2 / (wavelength**5)
-        denominator = np.expm1(
-            exponent
-        )  # expm1(x) = exp(x) - 1, more accurate for small x
-
-        return numerator / denominator
+    # All the spectra at once, one row per temperature
+    wavelength, spectral_radiance = radiance_grid(
+        temperatures, wavelength_range, num_points
+    )
 
     # Create the plot
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -68,18 +37,16 @@ def plot_planck_law(
     # Plot curves for different temperatures
     colors = plt.cm.viridis(np.linspace(0, 1, len(temperatures)))
 
-    for i, temp in enumerate(temperatures):
-        spectral_radiance = planck_spectral_radiance(wavelength, temp)
-
-        # Convert wavelength to nanometers for plotting
-        wavelength_nm = wavelength * 1e9
+    # Convert wavelength to nanometers for plotting
+    wavelength_nm = wavelength * 1e9
 
-        # Convert spectral radiance to more convenient units (kW⋅sr⁻¹⋅m⁻²⋅nm⁻¹)
-        spectral_radiance_scaled = spectral_radiance * 1e-12  # Convert to kW and per nm
+    # Convert spectral radiance to more convenient units (kW⋅sr⁻¹⋅m⁻²⋅nm⁻¹)
+    spectral_radiance_scaled = spectral_radiance * 1e-12  # Convert to kW and per nm
 
+    for i, temp in enumerate(temperatures):
         ax.plot(
             wavelength_nm,
-            spectral_radiance_scaled,
+            spectral_radiance_scaled[i],
             color=colors[i],
             linewidth=2,
             label=f"{temp} K",
@@ -109,25 +76,6 @@ def plot_planck_law(
     return fig, ax
 
 
-def find_wien_displacement_peak(temperature):
-    """
-    Find the wavelength of maximum emission using Wien's displacement law.
-
-    λ_max = b / T, where b = 2.897771955×10⁻³ m⋅K
-
-    Parameters:
-    -----------
-    temperature : float
-        Temperature in Kelvin
-
-    Returns:
-    --------
-    float : Peak wavelength in meters
-    """
-    wien_constant = 2.897771955e-3  # Wien's displacement constant (m⋅K)
-    return wien_constant / temperature
-
-
 # Example usage and demonstration
 if __name__ == "__main__":
     # Plot standard blackbody curves
@@ -136,18 +84,11 @@ if __name__ == "__main__":
     # Add Wien's displacement law peaks
     temperatures = [3000, 4000, 5000, 6000]
     for temp in temperatures:
-        peak_wavelength = find_wien_displacement_peak(temp)
+        peak_wavelength = wien_displacement(temp)
         peak_wavelength_nm = peak_wavelength * 1e9
 
         # Find the spectral radiance at peak
-        h = 6.62607015e-34
-        c = 299792458
-        k_B = 1.380649e-23
-
-        exponent = (h * c) / (peak_wavelength * k_B * temp)
-        numerator = 2 * h * c**2 / (peak_wavelength**5)
-        denominator = np.expm1(exponent)
-        peak_radiance = (numerator / denominator) * 1e-12
+        peak_radiance = planck_spectral_radiance(peak_wavelength, temp) * 1e-12
 
         # Mark the peak on the plot
         ax.plot(peak_wavelength_nm, peak_radiance, "ro", markersize=6)
@@ -158,10 +99,10 @@ if __name__ == "__main__":
     print("\nWien's Displacement Law - Peak Wavelengths:")
     print("-" * 40)
     for temp in temperatures:
-        peak_wavelength_nm = find_wien_displacement_peak(temp) * 1e9
+        peak_wavelength_nm = wien_displacement(temp) * 1e9
         print(f"T = {temp} K: λ_max = {peak_wavelength_nm:.0f} nm")
 
     # Additional example: Solar temperature
     print(f"\nSun's surface temperature (~5778 K):")
-    solar_peak = find_wien_displacement_peak(5778) * 1e9
+    solar_peak = wien_displacement(5778) * 1e9
     print(f"Peak wavelength: {solar_peak:.0f} nm (Green light)")
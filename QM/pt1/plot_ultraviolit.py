@@ -1,32 +1,18 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Constants
-h = 6.626e-34  # Planck's constant (J·s)
-c = 3.0e8  # Speed of light (m/s)
-k = 1.38e-23  # Boltzmann constant (J/K)
+from spectra import planck_spectral_radiance, rayleigh_jeans
+
 T = 5000  # Temperature (K)
 
 # Wavelength range in micrometers
 lambda_micrometers = np.linspace(0.1, 3, 1000)
 lambda_meters = lambda_micrometers * 1e-6  # Convert to meters
 
-
 # Planck's radiation law
-def planck(wav, T):
-    a = 8 * np.pi * h * c / wav**5
-    b = h * c / (wav * k * T)
-    return a / (np.exp(b) - 1)
-
-
-B_planck = planck(lambda_meters, T)
-
+B_planck = planck_spectral_radiance(lambda_meters, T)
 
 # Rayleigh-Jeans law
-def rayleigh_jeans(wav, T):
-    return 8 * np.pi * k * T / wav**4
-
-
 B_rj = rayleigh_jeans(lambda_meters, T)
 
 # Create the plot
@@ -1,18 +1,30 @@
 import gettext
+import os
+import sys
 from functools import partial
 from pathlib import Path
 
 import numpy as np
 from manim import *
 
-# Setup translation with its domain
-languages = ["ar", "en"]
+from glow import Glow, SquareGlow
+from spectra import planck_spectral_radiance, rayleigh_jeans
+
+# Shared tooling at the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from animtools import bloom, checkpoint, graphs
+from blackbody import BlackbodyCurve
+from blackbody_color import blackbody_color
+
+# Setup translation with its domain; ANIM_LANG picks the cut to render
+LANG = os.environ.get("ANIM_LANG", "ar")
+languages = [LANG, "en"]
 localedir = Path(__file__).parent / "locale"
 t = gettext.translation("messages", localedir, languages, fallback=True)
 t.install()
 _ = t.gettext
 # right to left lang ?
-IS_RTL = True
+IS_RTL = LANG == "ar"
 FONT = "Aref Ruqaa"
 FONT = "Waseem"
 
@@ -35,79 +47,18 @@ config.tex_template.add_to_preamble(
 
 
 def create_square_glow(vmobject, length: float = 1, color=YELLOW):
-    glow_group = VGroup()
-
-    for idx in range(50):
-        glow_group.add(
-            Cube(
-                length * (1.01**idx),
-                stroke_opacity=0,
-                fill_color=color,
-                fill_opacity=0.006 - idx / 10_000,
-            ).move_to(vmobject)
-        )
-
-    return glow_group
+    # One sprite with the look of the 50 stacked Cubes it replaces
+    return SquareGlow(length, color).move_to(vmobject)
 
 
 def create_glow(vmobject, rad=1, col=YELLOW):
-    glow_group = VGroup()
-
-    for idx in range(60):
-        glow_group.add(
-            Circle(
-                radius=rad * (1.002 ** (idx**2)) / 400,
-                stroke_opacity=0,
-                fill_color=col,
-                fill_opacity=0.2 - idx / 300,
-            ).move_to(vmobject)
-        )
-
-    return glow_group
+    # One texture with the falloff the 60 stacked Circles used to give
+    return Glow(rad, col).move_to(vmobject)
 
 
-# Constants
-k_B = 1.380649e-23  # Boltzmann constant
-c = 2.998e8  # Speed of light
-
-
-def rayleigh_jeans(wavelength, temperature):
+def rayleigh_jeans_nm(wavelength_nm, temperature):
     # with scaling to kW
-    return (2 * c * k_B * temperature) / (wavelength**4) * 1e-12
-
-
-def planck_spectral_radiance(wavelength, temperature):
-    """
-    Calculate spectral radiance using Planck's law.
-
-    B(λ,T) = (2hc²/λ⁵) × 1/(exp(hc/λkT) - 1)
-
-    Parameters:
-    -----------
-    wavelength : float or array
-        Wavelength in meters
-    temperature : float
-        Temperature in Kelvin
-
-    Returns:
-    --------
-    float or array : Spectral radiance in W⋅sr⁻¹⋅m⁻³
-    """
-    # Physical constants
-    h = 6.62607015e-34  # Planck constant (J⋅s)
-    c = 299792458  # Speed of light (m/s)
-    k_B = 1.380649e-23  # Boltzmann constant (J/K)
-
-    # Avoid division by zero and overflow
-    exponent = (h * c) / (wavelength * k_B * temperature)
-
-    # Use np.clip to avoid overflow in exponential
-    exponent = np.clip(exponent, 0, 700)  # e^700 is near float64 limit
-
-    numerator = 2 * h * c**2 / (wavelength**5)
-    denominator = np.expm1(exponent)  # expm1(x) = exp(x) - 1, more accurate for small x
-
-    return numerator / denominator
+    return rayleigh_jeans(wavelength_nm * 1e-9, temperature) * 1e-12
 
 
 def planck_spectral_radiance_normalized(wavelength, temperature, scale_factor=1e-12):
@@ -136,62 +87,6 @@ def planck_function_nm(wavelength_nm, temperature, scale_factor=1e-12):
     return planck_spectral_radiance_normalized(wavelength_m, temperature, scale_factor)
 
 
-def stefan_boltzmann_law(temperature):
-    """
-    Calculate total radiated power using Stefan-Boltzmann law.
-
-    j* = σT⁴, where σ = 5.670374419×10⁻⁸ W⋅m⁻²⋅K⁻⁴
-
-    Parameters:
-    -----------
-    temperature : float
-        Temperature in Kelvin
-
-    Returns:
-    --------
-    float : Total radiated power per unit area (W⋅m⁻²)
-    """
-    stefan_boltzmann_constant = 5.670374419e-8  # W⋅m⁻²⋅K⁻⁴
-    return stefan_boltzmann_constant * temperature**4
-
-
-def get_wavelength_array(wavelength_range_nm=(200, 3000), num_points=1000):
-    """
-    Generate wavelength array for plotting.
-
-    Parameters:
-    -----------
-    wavelength_range_nm : tuple
-        Wavelength range in nanometers (min, max)
-    num_points : int
-        Number of points
-
-    Returns:
-    --------
-    array : Wavelength array in nanometers
-    """
-    return np.linspace(wavelength_range_nm[0], wavelength_range_nm[1], num_points)
-
-
-def wien_displacement(temperature):
-    """
-    Find the wavelength of maximum emission using Wien's displacement law.
-
-    λ_max = b / T, where b = 2.897771955×10⁻³ m⋅K
-
-    Parameters:
-    -----------
-    temperature : float
-        Temperature in Kelvin
-
-    Returns:
-    --------
-    float : Peak wavelength in meters
-    """
-    wien_constant = 2.897771955e-3  # Wien's displacement constant (m⋅K)
-    return wien_constant / temperature
-
-
 class Introduction(ThreeDScene):
     """
     # Points to mention:
@@ -333,8 +228,12 @@ class Introduction(ThreeDScene):
             stroke_opacity=1,
         )
         cube.set_shade_in_3d(True)
+        cube.rotate(PI / 2, RIGHT)
         glow_cube = create_square_glow(cube, 2).set_z_index(-2)
-        black_body = VGroup(glow_cube, cube).to_edge(LEFT).rotate(PI / 2, RIGHT)
+        # The glow is a flat sprite: keep it facing the camera. Only the camera
+        # is told, the FadeIn below adds it to the scene
+        self.renderer.camera.add_fixed_orientation_mobjects(glow_cube)
+        black_body = Group(glow_cube, cube).to_edge(LEFT)
 
         #### Animation sequence ####
 
@@ -370,36 +269,60 @@ class Introduction(ThreeDScene):
 
         # Simulate temperature changes with color shifts
         temperatures = [2000, 3000, 4000, 5000, 5500]
-        colors = [0xFF0017, 0xFF7C00, 0xCEB04D, 0x83B28D, 0x3DA8AD]
 
         # Introduce the black body visuals
         self.play(FadeIn(black_body[1]))
         self.play(Rotate(black_body[1], axis=UP), run_time=4)
 
+        # The curve, the glow and the readout all follow this temperature,
+        # in the color a black body has at it
+        temperature = ValueTracker(temperatures[0])
+
+        def temperature_color():
+            return blackbody_color(temperature.get_value())
+
+        # Called now too: FadeIn suspends it, and the glow must not fade in
+        # in its default yellow
+        black_body[0].add_updater(
+            lambda m: m.set_color(temperature_color()), call_updater=True
+        )
+
         # Temperature indicator
-        temp_value = Text("1000 K", font_size=28, color=colors[0])
+        temp_value = DecimalNumber(
+            temperatures[0],
+            num_decimal_places=0,
+            group_with_commas=False,
+            unit=r"\mathrm{K}",
+            font_size=28,
+            color=temperature_color(),
+        )
         temp_value.next_to(black_body, DOWN)
+        temp_value.add_updater(
+            lambda m: m.set_value(temperature.get_value()).set_color(
+                temperature_color()
+            )
+        )
         self.play(FadeIn(black_body[0]))
         self.play(FadeIn(temp_value))
         self.play(Indicate(temp_value))
 
         # Plot first Plank curve
-        graph = axes.plot(partial(planck_function_nm, temperature=colors[0]))
+        graph = BlackbodyCurve(
+            axes,
+            temperature,
+            planck_function_nm,
+            t_range=(temperatures[0], temperatures[-1]),
+        )
         self.play(Create(graph))
 
-        for temp, color in zip(temperatures[1:], colors[1:]):
-            new_temp_value = Text(f"{temp} K", font_size=28, color=color)
-            new_temp_value.move_to(temp_value.get_center())
-
-            self.play(
-                Transform(temp_value, new_temp_value),
-                Transform(
-                    graph, axes.plot(partial(planck_function_nm, temperature=temp))
-                ),
-                black_body[0].animate.set_color(color),
-                run_time=1.5,
-            )
+        # Only follow the temperature while it changes: idle updaters cost
+        # every frame and keep waits from rendering in parallel
+        followers = [black_body[0], temp_value, graph]
+        for temp in temperatures[1:]:
+            self.play(temperature.animate.set_value(temp), run_time=1.5)
             self.wait(0.5)
+        for mob in followers:
+            mob.suspend_updating()
 
         # Show Wien's law equation
         wien_label = (
@@ -428,29 +351,21 @@ class Introduction(ThreeDScene):
         self.play(Transform(wien_eq, tmp))
 
         # Repeate plots but with Wien's law as points
+        peak = graph.get_peak_dot(stroke_width=1, fill_color=BLACK)
+        followers.append(peak)
+        for mob in followers:
+            mob.resume_updating()
+        self.play(FadeIn(peak))
         peak_dots = VGroup()
-        for temp, color in zip(temperatures, colors):
-            new_temp_value = Text(f"{temp} K", font_size=28, color=color)
-            new_temp_value.move_to(temp_value.get_center())
-
-            self.play(
-                Transform(temp_value, new_temp_value),
-                Transform(
-                    graph, axes.plot(partial(planck_function_nm, temperature=temp))
-                ),
-                black_body[0].animate.set_color(color),
-                run_time=1.5,
-            )
+        for temp in temperatures:
+            self.play(temperature.animate.set_value(temp), run_time=1.5)
             self.wait(0.5)
 
-            peak_at_nm = wien_displacement(temp) / 1e-9
-            peak_dot = axes.plot_line_graph(
-                [peak_at_nm],
-                [planck_function_nm(peak_at_nm, temp)],
-                vertex_dot_style={"stroke_width": 1, "fill_color": BLACK},
-            )
+            peak_dot = peak.copy().clear_updaters()
             self.play(Create(peak_dot))
             peak_dots += peak_dot
+        for mob in followers:
+            mob.clear_updaters()
 
         # Clean Screen except the title
         self.play(*[FadeOut(mobj) for mobj in self.mobjects if mobj != title])
@@ -515,7 +430,8 @@ class Introduction(ThreeDScene):
 class RayleighJeansCatastrophe(Introduction):
     def construct(self):
 
-        super().construct()
+        # Restores where `Introduction` ends instead of replaying all of it
+        checkpoint.prefix(self, super().construct)
 
         self.axes.shift(DOWN / 2)
 
@@ -530,24 +446,22 @@ class RayleighJeansCatastrophe(Introduction):
 
         # Create graphs for different temperatures
         temperatures = [3000, 4000, 5000]
-        graphs = VGroup()
+        rj_graphs = VGroup()
         temp_labels = VGroup()
 
         for temp in temperatures:
-            wavelengths = np.linspace(1100e-9, 3000e-9, 100)
-            spectral_radiance = [rayleigh_jeans(w, temp) for w in wavelengths]
-
-            graph = self.axes.plot_line_graph(
-                x_values=wavelengths * 1e9,
-                y_values=spectral_radiance,
-                line_color=BLUE,
-                add_vertex_dots=False,
+            # Dense only where it shoots up, cut at the top of the axes
+            graph = graphs.plot_adaptive(
+                self.axes,
+                partial(rayleigh_jeans_nm, temperature=temp),
+                color=BLUE,
+                stroke_width=2,
             )
 
             temp_label = Text(f"{temp}K", font_size=24, color=BLUE_A)
             temp_label.next_to(graph, LEFT)
 
-            graphs.add(graph)
+            rj_graphs.add(graph)
             temp_labels.add(temp_label)
 
         #### Animation sequence ####
@@ -566,7 +480,7 @@ class RayleighJeansCatastrophe(Introduction):
         self.play(Create(self.axes))
 
         # Show Rayleigh-Jeans plots
-        for graph, label in zip(graphs, temp_labels):
+        for graph, label in zip(rj_graphs, temp_labels):
             self.play(Create(graph), Write(label), run_time=1.5)
             self.wait(0.5)
 
@@ -628,6 +542,7 @@ class PlanckLaw(Scene):
 
         # Create nucleus
         nucleus = Dot(ORIGIN, radius=0.15, color=RED).shift(DOWN)
+        bloom.tag(nucleus)
         nucleus_label = Text(_("Nucleus"), font_size=20).next_to(
             nucleus, DOWN, buff=0.3
         )
@@ -651,6 +566,7 @@ class PlanckLaw(Scene):
 
         # Create electron
         electron = Dot(radius=0.1, color=YELLOW).set_z_index(2)
+        bloom.tag(electron, radius=0.15)
         electron.move_to(ground_orbit.point_at_angle(PI / 2))
         electron_label = Text("e⁻", font_size=24, color=YELLOW).next_to(electron, DOWN)
 
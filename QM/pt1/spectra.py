@@ -0,0 +1,192 @@
+"""
+Black-body radiation laws, shared by the manim scenes and the matplotlib
+scripts.
+
+Every function takes wavelengths in meters and temperatures in Kelvin as
+scalars or arrays of any shape that broadcast together, e.g. a column of
+temperatures against a row of wavelengths gives one spectrum per row.
+`dtype` picks float64 (default) or float32; the kernels work in micrometers
+internally so that float32 neither overflows nor underflows on λ⁵.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Physical constants (exact SI values)
+h = 6.62607015e-34  # Planck constant (J⋅s)
+c = 299792458  # Speed of light (m/s)
+k_B = 1.380649e-23  # Boltzmann constant (J/K)
+WIEN_CONSTANT = 2.897771955e-3  # Wien's displacement constant (m⋅K)
+STEFAN_BOLTZMANN_CONSTANT = 5.670374419e-8  # W⋅m⁻²⋅K⁻⁴
+
+# The same laws with the wavelength in µm: B = C1 / λ⁵ / (exp(C2 / λT) - 1)
+UM = 1e-6
+C1 = 2 * h * c**2 / UM**5  # W⋅sr⁻¹⋅m⁻³⋅µm⁵
+C2 = h * c / k_B / UM  # µm⋅K
+RJ = 2 * c * k_B / UM**4  # W⋅sr⁻¹⋅m⁻³⋅µm⁴⋅K⁻¹
+
+
+def _arrays(wavelength, temperature, dtype):
+    """Wavelength in µm and temperature, as `dtype` arrays."""
+    wavelength = np.asarray(wavelength, dtype=dtype) / dtype(UM)
+    return wavelength, np.asarray(temperature, dtype=dtype)
+
+
+def planck_spectral_radiance(wavelength, temperature, dtype=np.float64):
+    """
+    Calculate spectral radiance using Planck's law.
+
+    B(λ,T) = (2hc²/λ⁵) × 1/(exp(hc/λkT) - 1)
+
+    Parameters:
+    -----------
+    wavelength : float or array
+        Wavelength in meters
+    temperature : float or array
+        Temperature in Kelvin, broadcast against `wavelength`
+    dtype : type
+        np.float64 or np.float32
+
+    Returns:
+    --------
+    float or array : Spectral radiance in W⋅sr⁻¹⋅m⁻³
+    """
+    wavelength, temperature = _arrays(wavelength, temperature, dtype)
+
+    exponent = dtype(C2) / (wavelength * temperature)
+
+    # 1 / (exp(x) - 1) as exp(-x) / (1 - exp(-x)): no overflow for large x in
+    # either dtype, and expm1 keeps it accurate for small x
+    return dtype(C1) / wavelength**5 * np.exp(-exponent) / -np.expm1(-exponent)
+
+
+def rayleigh_jeans(wavelength, temperature, dtype=np.float64):
+    """
+    Spectral radiance by the classical Rayleigh-Jeans law.
+
+    B(λ,T) = 2ckT / λ⁴
+
+    Parameters:
+    -----------
+    wavelength : float or array
+        Wavelength in meters
+    temperature : float or array
+        Temperature in Kelvin, broadcast against `wavelength`
+    dtype : type
+        np.float64 or np.float32
+
+    Returns:
+    --------
+    float or array : Spectral radiance in W⋅sr⁻¹⋅m⁻³
+    """
+    wavelength, temperature = _arrays(wavelength, temperature, dtype)
+    return dtype(RJ) * temperature / wavelength**4
+
+
+def wien_displacement(temperature, dtype=np.float64):
+    """
+    Find the wavelength of maximum emission using Wien's displacement law.
+
+    λ_max = b / T, where b = 2.897771955×10⁻³ m⋅K
+
+    Parameters:
+    -----------
+    temperature : float or array
+        Temperature in Kelvin
+
+    Returns:
+    --------
+    float or array : Peak wavelength in meters
+    """
+    return dtype(WIEN_CONSTANT) / np.asarray(temperature, dtype=dtype)
+
+
+def stefan_boltzmann_law(temperature, dtype=np.float64):
+    """
+    Calculate total radiated power using Stefan-Boltzmann law.
+
+    j* = σT⁴, where σ = 5.670374419×10⁻⁸ W⋅m⁻²⋅K⁻⁴
+
+    Parameters:
+    -----------
+    temperature : float or array
+        Temperature in Kelvin
+
+    Returns:
+    --------
+    float or array : Total radiated power per unit area (W⋅m⁻²)
+    """
+    return dtype(STEFAN_BOLTZMANN_CONSTANT) * np.asarray(temperature, dtype=dtype) ** 4
+
+
+def get_wavelength_array(wavelength_range_nm=(200, 3000), num_points=1000):
+    """
+    Generate wavelength array for plotting.
+
+    Parameters:
+    -----------
+    wavelength_range_nm : tuple
+        Wavelength range in nanometers (min, max)
+    num_points : int
+        Number of points
+
+    Returns:
+    --------
+    array : Wavelength array in nanometers
+    """
+    return np.linspace(wavelength_range_nm[0], wavelength_range_nm[1], num_points)
+
+
+LAWS = {"planck": planck_spectral_radiance, "rayleigh_jeans": rayleigh_jeans}
+
+
+@lru_cache(maxsize=32)
+def _grid(law, temperatures, wavelength_range, num_points, dtype):
+    wavelength = np.linspace(*wavelength_range, num_points, dtype=dtype)
+    temperature = np.array(temperatures, dtype=dtype)[:, None]
+    radiance = LAWS[law](wavelength, temperature, dtype)
+    wavelength.flags.writeable = False
+    radiance.flags.writeable = False
+    return wavelength, radiance
+
+
+def radiance_grid(
+    temperatures,
+    wavelength_range=(200e-9, 3000e-9),
+    num_points=1000,
+    law="planck",
+    dtype=np.float64,
+):
+    """
+    Spectra of several temperatures on one wavelength grid, memoized.
+
+    Repeated calls with the same grid (every rebuild of a scene, every
+    replot) return the same arrays instead of computing them again; they
+    are read-only, so copy them before changing them in place.
+
+    Parameters:
+    -----------
+    temperatures : iterable
+        Temperatures in Kelvin, one row each
+    wavelength_range : tuple
+        Wavelength range in meters (min_wavelength, max_wavelength)
+    num_points : int
+        Number of wavelengths
+    law : str
+        "planck" or "rayleigh_jeans"
+    dtype : type
+        np.float64 or np.float32
+
+    Returns:
+    --------
+    wavelength, radiance : arrays of shape (num_points,) and
+        (len(temperatures), num_points), in meters and W⋅sr⁻¹⋅m⁻³
+    """
+    return _grid(
+        law,
+        tuple(float(t) for t in np.atleast_1d(temperatures)),
+        tuple(float(w) for w in wavelength_range),
+        int(num_points),
+        np.dtype(dtype).type,
+    )
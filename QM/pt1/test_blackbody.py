@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from manim import Axes, ValueTracker, VMobject  # noqa: E402
+
+import spectra  # noqa: E402
+from animtools import graphs  # noqa: E402
+from blackbody import BlackbodyCurve  # noqa: E402
+
+# Rows 25 K apart are off by up to 1.4e-3 kW⋅sr⁻¹⋅m⁻³ near the peak, about
+# 2.5e-4 scene units on these axes
+ATOL = 3e-4
+
+
+def planck_nm(wavelength_nm, temperature):
+    return spectra.planck_spectral_radiance(wavelength_nm * 1e-9, temperature) * 1e-12
+
+
+@pytest.fixture
+def curve():
+    # The Introduction axes, without the TeX numbers
+    axes = Axes(x_range=[1, 3000, 100], y_range=[0, 25, 2], tips=False).scale(0.75)
+    return BlackbodyCurve(axes, ValueTracker(2000), planck_nm)
+
+
+def at(curve, temperature):
+    curve.temperature.set_value(temperature)
+    curve.update()
+    return curve.points
+
+
+@pytest.mark.parametrize("temperature", [2000, 3010, 4321.5, 5500])
+def test_anchors_are_on_the_planck_curve(curve, temperature):
+    anchors = at(curve, temperature)[::4]
+    wavelengths = curve.wavelengths[:-1]
+    expected = graphs.coords_to_points(
+        curve.axes, wavelengths, planck_nm(wavelengths, temperature)
+    )
+    np.testing.assert_allclose(anchors, expected, atol=ATOL)
+
+
+@pytest.mark.parametrize("temperature", [2000, 3010, 4321.5, 5500])
+def test_blend_matches_a_curve_plotted_at_the_temperature(curve, temperature):
+    direct = VMobject().set_points_smoothly(
+        graphs.coords_to_points(
+            curve.axes, curve.wavelengths, planck_nm(curve.wavelengths, temperature)
+        )
+    )
+    np.testing.assert_allclose(at(curve, temperature), direct.points, atol=ATOL)
+
+
+def test_rows_are_exact(curve):
+    direct = VMobject().set_points_smoothly(
+        graphs.coords_to_points(
+            curve.axes, curve.wavelengths, planck_nm(curve.wavelengths, 3000)
+        )
+    )
+    np.testing.assert_allclose(at(curve, 3000), direct.points, atol=1e-9)
+
+
+def test_peak_dot_follows_wien(curve):
+    dot = curve.get_peak_dot()
+    at(curve, 4000)
+    dot.update()
+    peak_nm = spectra.wien_displacement(4000) / 1e-9
+    np.testing.assert_allclose(
+        dot.get_center(), curve.axes.c2p(peak_nm, planck_nm(peak_nm, 4000))
+    )
+    assert curve.points[:, 1].max() <= dot.get_center()[1] + ATOL
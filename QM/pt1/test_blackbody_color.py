@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import blackbody_color
+
+
+def rgb(temperatures):
+    return blackbody_color.xyz_to_rgb(blackbody_color.blackbody_xyz(temperatures))
+
+
+@pytest.fixture
+def table(tmp_path, monkeypatch):
+    # Saved under a temporary directory instead of manim's media directory
+    path = tmp_path / "blackbody.npy"
+    monkeypatch.setattr(blackbody_color, "_path", lambda: path)
+    blackbody_color.rgb_table.cache_clear()
+    yield path
+    blackbody_color.rgb_table.cache_clear()
+
+
+def test_daylight_is_about_white():
+    # The sRGB white point is D65, close to a black body at 6500 K
+    np.testing.assert_allclose(rgb([6500])[0], 1, atol=0.05)
+
+
+def test_cool_bodies_are_red():
+    red, green, blue = rgb([1000])[0]
+    assert red == pytest.approx(1)
+    assert green < 0.5 * red
+    assert blue < 0.05
+
+
+def test_hot_bodies_are_blue():
+    red, green, blue = rgb([20_000])[0]
+    assert blue == pytest.approx(1)
+    assert red < green < blue
+
+
+def test_channels_follow_the_temperature():
+    colors = rgb(np.arange(2000, 6000, 100))
+    np.testing.assert_allclose(colors[:, 0], 1)
+    assert np.all(np.diff(colors[:, 1:], axis=0) > 0)
+
+
+def test_table_is_saved_and_interpolated(table):
+    color = blackbody_color.blackbody_rgb(3000)
+    assert table.exists()
+    np.testing.assert_allclose(color, rgb([3000])[0], atol=1e-12)
+
+    between = blackbody_color.blackbody_rgb(3005)
+    np.testing.assert_allclose(between, rgb([3000, 3010]).mean(axis=0), atol=1e-12)
+
+    blackbody_color.rgb_table.cache_clear()
+    assert not blackbody_color.rgb_table().flags.writeable
+    np.testing.assert_array_equal(blackbody_color.blackbody_rgb(3005), between)
+
+
+def test_temperatures_outside_the_table_are_clamped(table):
+    np.testing.assert_array_equal(
+        blackbody_color.blackbody_rgb(0),
+        blackbody_color.blackbody_rgb(blackbody_color.T_MIN),
+    )
+    np.testing.assert_array_equal(
+        blackbody_color.blackbody_rgb(1e6),
+        blackbody_color.blackbody_rgb(blackbody_color.T_MAX),
+    )
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import spectra
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from animtools import graphs  # noqa: E402
+
+# The RayleighJeansCatastrophe axes: x_range=[1, 3000, 100], y_range=[0, 25]
+# at a scale of 0.75, without manim
+X_TICKS = np.append(np.arange(1, 3000, 100), 3000)
+Y_RANGE = (0, 25)
+UNIT = np.array([9 / 3000, 4.5 / 25])
+
+
+def to_screen(xs, ys):
+    return np.stack([xs * UNIT[0], ys * UNIT[1], np.zeros_like(xs)], axis=1)
+
+
+def rayleigh_jeans_nm(wavelength_nm, temperature):
+    return spectra.rayleigh_jeans(wavelength_nm * 1e-9, temperature) * 1e-12
+
+
+def screen_error(xs, ys, function, dense):
+    """Largest distance on screen between the polyline and the graph."""
+    inside = (dense >= xs[0]) & (dense <= xs[-1])
+    dense = dense[inside]
+    exact = np.clip(function(dense), *Y_RANGE)
+    return np.max(np.abs(np.interp(dense, xs, ys) - exact)) * UNIT[1]
+
+
+def scalar_only(x):
+    if x < 1000:
+        return 0.0
+    return x / 1000
+
+
+def test_supports_arrays():
+    sample = X_TICKS[[0, 15, -1]]
+    assert graphs.supports_arrays(lambda x: rayleigh_jeans_nm(x, 4000), sample)
+    # Raises on arrays ("truth value of an array is ambiguous")
+    assert not graphs.supports_arrays(scalar_only, sample)
+    # Runs on arrays but not element-wise
+    assert not graphs.supports_arrays(lambda x: np.sum(x) + x, sample)
+    assert not graphs.supports_arrays(lambda x: 1.0, sample)
+
+
+def test_vectorized_falls_back_to_a_loop():
+    sample = X_TICKS[[0, 15, -1]]
+    function = graphs.vectorized(scalar_only, sample)
+    np.testing.assert_array_equal(function(X_TICKS), [scalar_only(x) for x in X_TICKS])
+
+    runs = graphs.sample_adaptively(scalar_only, X_TICKS, Y_RANGE, to_screen)
+    for xs, ys in runs:
+        np.testing.assert_array_equal(ys, [scalar_only(x) for x in xs])
+
+
+@pytest.mark.parametrize("temperature", [3000, 4000, 5000])
+def test_adaptive_samples_hold_the_tolerance(temperature):
+    def function(x):
+        return rayleigh_jeans_nm(x, temperature)
+
+    runs = graphs.sample_adaptively(function, X_TICKS, Y_RANGE, to_screen)
+    dense = np.linspace(1, 3000, 1_000_001)
+
+    # One stretch, from where the graph enters the axes to the end
+    assert len(runs) == 1
+    xs, ys = runs[0]
+    assert ys[0] == pytest.approx(Y_RANGE[1])
+    assert xs[-1] == 3000
+    assert screen_error(xs, ys, function, dense) <= graphs.TOLERANCE
+
+    # Evenly spaced samples over the same stretch miss it with twice as many
+    uniform = np.linspace(xs[0], xs[-1], 2 * len(xs))
+    error = screen_error(uniform, function(uniform), function, dense)
+    assert error > graphs.TOLERANCE
+
+
+def test_graph_leaving_and_entering_the_range_is_cut():
+    def function(x):
+        return 30 * np.sin(x / 300) ** 2
+
+    runs = graphs.sample_adaptively(function, X_TICKS, Y_RANGE, to_screen)
+    assert len(runs) == 4
+    for xs, ys in runs:
+        assert np.all(np.diff(xs) > 0)
+        assert np.all((ys >= Y_RANGE[0]) & (ys <= Y_RANGE[1]))
+    for (xs, _), (next_xs, _) in zip(runs, runs[1:]):
+        assert function(xs[-1]) == pytest.approx(Y_RANGE[1])
+        assert function(next_xs[0]) == pytest.approx(Y_RANGE[1])
@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+import spectra
+
+TEMPERATURES = np.array([1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 5500.0, 6000.0])
+WAVELENGTHS = np.linspace(100e-9, 3000e-9, 500)
+
+
+# The formulas `spectra` replaces, as they were in scene.py and plot_planck.py
+
+
+def legacy_planck_spectral_radiance(wavelength, temperature):
+    h = 6.62607015e-34  # Planck constant (J⋅s)
+    c = 299792458  # Speed of light (m/s)
+    k_B = 1.380649e-23  # Boltzmann constant (J/K)
+
+    exponent = (h * c) / (wavelength * k_B * temperature)
+    exponent = np.clip(exponent, 0, 700)
+    numerator = 2 * h * c**2 / (wavelength**5)
+    denominator = np.expm1(exponent)
+    return numerator / denominator
+
+
+def legacy_rayleigh_jeans(wavelength, temperature):
+    k_B = 1.380649e-23
+    c = 2.998e8
+    return (2 * c * k_B * temperature) / (wavelength**4) * 1e-12
+
+
+def legacy_stefan_boltzmann_law(temperature):
+    stefan_boltzmann_constant = 5.670374419e-8
+    return stefan_boltzmann_constant * temperature**4
+
+
+def legacy_wien_displacement(temperature):
+    wien_constant = 2.897771955e-3
+    return wien_constant / temperature
+
+
+@pytest.mark.parametrize("temperature", TEMPERATURES)
+def test_planck_matches_legacy(temperature):
+    np.testing.assert_allclose(
+        spectra.planck_spectral_radiance(WAVELENGTHS, temperature),
+        legacy_planck_spectral_radiance(WAVELENGTHS, temperature),
+        rtol=1e-12,
+    )
+
+
+def test_planck_scalar_matches_legacy():
+    assert spectra.planck_spectral_radiance(500e-9, 5778) == pytest.approx(
+        legacy_planck_spectral_radiance(500e-9, 5778), rel=1e-12
+    )
+
+
+@pytest.mark.parametrize("temperature", TEMPERATURES)
+def test_rayleigh_jeans_matches_legacy(temperature):
+    # scene.py rounded c to 2.998e8 and scaled to kW
+    np.testing.assert_allclose(
+        spectra.rayleigh_jeans(WAVELENGTHS, temperature) * 1e-12,
+        legacy_rayleigh_jeans(WAVELENGTHS, temperature),
+        rtol=1e-4,
+    )
+
+
+def test_wien_and_stefan_boltzmann_match_legacy():
+    np.testing.assert_allclose(
+        spectra.wien_displacement(TEMPERATURES),
+        legacy_wien_displacement(TEMPERATURES),
+        rtol=1e-15,
+    )
+    np.testing.assert_allclose(
+        spectra.stefan_boltzmann_law(TEMPERATURES),
+        legacy_stefan_boltzmann_law(TEMPERATURES),
+        rtol=1e-15,
+    )
+
+
+def test_broadcasts_temperatures_against_wavelengths():
+    radiance = spectra.planck_spectral_radiance(WAVELENGTHS, TEMPERATURES[:, None])
+    assert radiance.shape == (len(TEMPERATURES), len(WAVELENGTHS))
+    for row, temperature in zip(radiance, TEMPERATURES):
+        np.testing.assert_allclose(
+            row, legacy_planck_spectral_radiance(WAVELENGTHS, temperature), rtol=1e-12
+        )
+
+
+@pytest.mark.parametrize(
+    "law", [spectra.planck_spectral_radiance, spectra.rayleigh_jeans]
+)
+def test_float32_agrees_with_float64(law):
+    wavelength = np.linspace(1e-9, 3000e-9, 1000)
+    single = law(wavelength, TEMPERATURES[:, None], dtype=np.float32)
+    double = law(wavelength, TEMPERATURES[:, None])
+    assert single.dtype == np.float32
+    assert np.all(np.isfinite(single)) and np.all(single >= 0)
+    # Deep in the Wien tail the values go below float32's range
+    visible = double > 1e-12 * double.max(axis=1, keepdims=True)
+    np.testing.assert_allclose(single[visible], double[visible], rtol=1e-5)
+
+
+def test_wien_peak_is_the_maximum():
+    wavelength = np.linspace(100e-9, 5000e-9, 200_001)
+    radiance = spectra.planck_spectral_radiance(wavelength, TEMPERATURES[:, None])
+    np.testing.assert_allclose(
+        wavelength[radiance.argmax(axis=1)],
+        spectra.wien_displacement(TEMPERATURES),
+        atol=wavelength[1] - wavelength[0],
+    )
+
+
+def test_planck_integrates_to_stefan_boltzmann():
+    # Radiance over wavelength and the hemisphere (π sr) is σT⁴
+    wavelength = np.geomspace(50e-9, 1e-3, 200_000)
+    radiance = spectra.planck_spectral_radiance(wavelength, TEMPERATURES[:, None])
+    steps = np.diff(wavelength)
+    exitance = np.pi * np.sum((radiance[:, 1:] + radiance[:, :-1]) / 2 * steps, axis=1)
+    np.testing.assert_allclose(
+        exitance, spectra.stefan_boltzmann_law(TEMPERATURES), rtol=1e-4
+    )
+
+
+def test_grid_is_memoized_and_read_only():
+    wavelength, radiance = spectra.radiance_grid([3000, 4000], num_points=50)
+    again = spectra.radiance_grid(np.array([3000.0, 4000.0]), num_points=50)
+    assert again[1] is radiance
+    assert not radiance.flags.writeable
+    np.testing.assert_allclose(
+        radiance,
+        legacy_planck_spectral_radiance(wavelength, np.array([[3000.0], [4000.0]])),
+        rtol=1e-12,
+    )
+
+    _, single = spectra.radiance_grid([3000, 4000], num_points=50, dtype=np.float32)
+    assert single.dtype == np.float32
+    assert single is not radiance
@@ -0,0 +1,6 @@
+"""
+Shared tooling for the manim projects in this repo.
+
+The watcher (`animtools.watch`) and the render daemon live here so that
+`collision/` and `QM/pt1/` can use the same code from their `auto_reload.py`.
+"""
@@ -0,0 +1,174 @@
+"""
+Checkpoints of a scene's mobjects at section boundaries.
+
+`RayleighJeansCatastrophe.construct` starts with `super().construct()`, which
+constructs and renders all of `Introduction` before its own first frame.
+With
+
+    checkpoint.prefix(self, super().construct)
+
+the first render runs the prefix with its animations skipped and pickles
+the resulting scene state (the mobjects on screen, the mobjects the prefix
+stored on `self`, and the 3D camera orientation). Later renders restore
+that state directly, skipping the construction too, until the source the
+prefix depends on changes: its part of the scene module, the sibling modules
+that imports, or `animtools`.
+
+Either way the prefix's animations are not part of the subclass's movie,
+nor of the renderer's clock and play count, so neither depends on whether a
+checkpoint existed; render the base scene to see them.
+"""
+
+import hashlib
+import inspect
+import linecache
+import os
+import pickle
+from pathlib import Path
+
+from animtools import deps, stats
+
+ORIENTATION = ("phi", "theta", "gamma", "focal_distance", "zoom")
+
+
+def _source_key(cls, name):
+    """Hash of everything the class `name` (defined next to `cls`) depends on."""
+    # The source that was executed (the daemon registers it), not the file
+    # as it is on disk now
+    path = inspect.getsourcefile(cls)
+    hashes, edges, _ = deps.analyse(path, "".join(linecache.getlines(path)))
+    # Translated strings end up in the mobjects too
+    digest = hashlib.sha1(os.environ.get("ANIM_LANG", "").encode())
+    # Sibling modules are in the hashes of the imports that load them
+    for dep in sorted(deps.closure(name, edges)):
+        digest.update(f"{dep}={hashes.get(dep)}\n".encode())
+    # The mobjects are partly built here (graphs, bloom)
+    for module in sorted(Path(__file__).parent.glob("*.py")):
+        if not module.name.startswith("test_"):
+            digest.update(module.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _path(scene, name, key):
+    from manim import config
+
+    return (
+        Path(config.media_dir)
+        / "checkpoints"
+        / type(scene).__name__
+        / f"{name}-{key}.pkl"
+    )
+
+
+def _state(scene):
+    from manim import Mobject
+
+    camera = scene.renderer.camera
+    return {
+        "mobjects": scene.mobjects,
+        "foreground_mobjects": scene.foreground_mobjects,
+        "attributes": {
+            attr: value
+            for attr, value in vars(scene).items()
+            if isinstance(value, Mobject)
+        },
+        "orientation": {
+            attr: getattr(camera, f"get_{attr}")()
+            for attr in ORIENTATION
+            if hasattr(camera, f"get_{attr}")
+        },
+        "fixed_in_frame": list(getattr(camera, "fixed_in_frame_mobjects", ())),
+    }
+
+
+def save(scene, name, key):
+    """Pickle the scene's current mobjects as checkpoint `name`."""
+    path = _path(scene, name, key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        data = pickle.dumps(_state(scene), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        # Updaters holding lambdas and the like; just run the prefix next time
+        print(f"[checkpoint] cannot save {name}: {e}")
+        return False
+
+    # Draft and high-quality renders may save the same checkpoint at once
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
+
+
+def restore(scene, name, key):
+    """Load checkpoint `name` into `scene`. Returns False if there is none."""
+    path = _path(scene, name, key)
+    if not path.exists():
+        return False
+    try:
+        state = pickle.loads(path.read_bytes())
+    except Exception as e:
+        print(f"[checkpoint] cannot load {name}: {e}")
+        return False
+
+    scene.add(*state["mobjects"])
+    scene.add_foreground_mobjects(*state["foreground_mobjects"])
+    for attr, value in state["attributes"].items():
+        setattr(scene, attr, value)
+    if state["orientation"]:
+        scene.set_camera_orientation(**state["orientation"])
+    if state["fixed_in_frame"]:
+        scene.add_fixed_in_frame_mobjects(*state["fixed_in_frame"])
+    return True
+
+
+def _skipping_animations(scene, construct):
+    """
+    Run `construct` without writing any of its frames, and leave the renderer
+    as a restore does: skipped plays still advance its clock, count and
+    hashes, which would shift every segment start after the prefix.
+    """
+    renderer = scene.renderer
+    file_writer = renderer.file_writer
+    skipping = renderer.skip_animations, renderer._original_skipping_status
+    clock = renderer.time, renderer.num_plays
+    hashes = len(renderer.animations_hashes)
+    sections = len(file_writer.sections)
+    partials = len(file_writer.sections[-1].partial_movie_files)
+
+    # play() resets skip_animations from _original_skipping_status
+    renderer.skip_animations = renderer._original_skipping_status = True
+    try:
+        construct()
+    finally:
+        renderer.skip_animations, renderer._original_skipping_status = skipping
+        renderer.time, renderer.num_plays = clock
+        del renderer.animations_hashes[hashes:]
+        # Placeholders for the skipped plays, and sections the prefix started
+        del file_writer.sections[sections:]
+        del file_writer.sections[-1].partial_movie_files[partials:]
+
+
+def prefix(scene, construct, name=None):
+    """
+    Run `construct` (usually `super().construct`), or restore its end state.
+
+    Parameters:
+    -----------
+    scene : Scene
+        The scene being constructed
+    construct : bound method
+        The part of the construction to checkpoint
+    name : str
+        Checkpoint name, defaults to the class that defines `construct`
+    """
+    owner = construct.__qualname__.split(".")[0]
+    name = name or owner
+    key = _source_key(type(scene), owner)
+
+    if restore(scene, name, key):
+        stats.bump("checkpoints", "restored")
+        return
+
+    _skipping_animations(scene, construct)
+    if save(scene, name, key):
+        stats.bump("checkpoints", "saved")
@@ -0,0 +1,344 @@
+"""
+Long-lived render daemon for the watchers.
+
+A zygote process imports manim once and then forks a child per render. The
+child executes the scene file as a brand new module, so every render starts
+from the zygote's clean `config` (the scene files mutate it at import time)
+without paying the interpreter start and `from manim import *` again.
+Independent scenes render in parallel, one child each.
+"""
+
+import collections
+import importlib.util
+import itertools
+import linecache
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import signal
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+from pathlib import Path
+
+from animtools import (
+    dedup,
+    dirty_rects,
+    frame_parallel,
+    incremental,
+    static_cache,
+    stats,
+    tex_batch,
+    tex_warm,
+    text_cache,
+)
+
+
+def _load_scene_module(path, source=None):
+    """
+    Execute the scene file in a fresh module namespace and return it. When
+    `source` is given it is used instead of the file's current contents, so
+    a job renders the revision it was created for.
+    """
+    module_name = path.stem
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    if source is None:
+        spec.loader.exec_module(module)
+    else:
+        # What inspect, tracebacks and checkpoint keys see for this file, even
+        # if it is saved again while we render
+        linecache.cache[str(path)] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            str(path),
+        )
+        exec(compile(source, str(path), "exec"), module.__dict__)
+    return module
+
+
+def _render(job):
+    """Render one scene inside a forked child and return a result dict."""
+    from manim import config
+
+    start = time.perf_counter()
+    if job.get("nice"):
+        os.nice(job["nice"])
+
+    path = Path(job["file"]).resolve()
+    os.chdir(path.parent)
+    sys.path.insert(0, str(path.parent))
+
+    # Same settings the `manim scene.py Scene -ql` command line used to give us
+    config.input_file = path
+    config.quality = job.get("quality", "low_quality")
+    config.write_to_movie = True
+    config.preview = False
+
+    if job.get("frame_workers"):
+        frame_parallel.install(job["frame_workers"])
+
+    # One pass per locale in this process, so the in-memory caches and the
+    # partial movies of locale-independent calls are shared between them
+    movies = {}
+    first_change = None
+    seen = set()
+    render_time = 0.0
+    for locale in job.get("locales") or [None]:
+        if locale is not None:
+            # Scene modules pick their translation from ANIM_LANG
+            os.environ["ANIM_LANG"] = locale
+            config.output_file = f"{job['scene']}_{locale}"
+
+        module = _load_scene_module(path, job.get("source"))
+        tex_warm.warm(job.get("source") or path.read_text(), vars(module))
+        scene = getattr(module, job["scene"])()
+        ready = time.perf_counter()
+
+        scene.render()
+        render_time += time.perf_counter() - ready
+
+        movies[locale] = str(scene.renderer.file_writer.movie_file_path)
+        change = incremental.finish(scene, config.output_file if locale else None)
+        if len(movies) == 1:
+            # The preview shows the first locale
+            first_change = change
+
+        if locale is not None:
+            hashes = [seg["hash"] for seg in getattr(scene.renderer, "segments", [])]
+            stats.bump("locales", "segments", len(hashes))
+            stats.bump("locales", "shared", sum(h in seen for h in hashes))
+            seen.update(hashes)
+
+    return {
+        "scene": job["scene"],
+        "quality": config.quality,
+        "movie": next(iter(movies.values())),
+        "movies": movies,
+        "startup": time.perf_counter() - start - render_time,
+        "render": render_time,
+        "first_change": first_change,
+        "stats": stats.snapshot(),
+    }
+
+
+def _run_child(job, write_fd):
+    """Body of the forked child: render, send the result back, never return."""
+    try:
+        os.setpgid(0, 0)
+        result = _render(job)
+    except BaseException:
+        result = {"scene": job["scene"], "error": traceback.format_exc()}
+
+    try:
+        with os.fdopen(write_fd, "wb") as f:
+            pickle.dump(result, f)
+    finally:
+        os._exit(0)
+
+
+def _zygote(conn, cwd, max_workers):
+    """
+    Import manim once, then fork one child per job sent over `conn`, running
+    at most `max_workers` of them at a time. Background jobs (positive
+    "nice") start after foreground ones and never take the last free slot,
+    so a draft render never waits behind them.
+    """
+    start = time.perf_counter()
+    os.chdir(cwd)
+    import manim  # noqa: F401  (this import is what we keep warm)
+
+    incremental.install()
+    static_cache.install()
+    tex_batch.install()
+    text_cache.install()
+    # dedup wraps dirty_rects: a reused frame needs no repaint at all
+    dirty_rects.install()
+    dedup.install()
+
+    conn.send(("ready", None, time.perf_counter() - start))
+
+    pending = collections.deque()
+    running = {}  # result pipe fd -> (job_id, job, pid, received bytes)
+
+    def next_job():
+        for index, (_, job) in enumerate(pending):
+            if not job.get("nice"):
+                break
+        else:
+            background = sum(1 for _, job, _, _ in running.values() if job.get("nice"))
+            if background >= max(1, max_workers - 1):
+                return None
+            index = 0
+        msg = pending[index]
+        del pending[index]
+        return msg
+
+    while True:
+        while pending and len(running) < max_workers:
+            msg = next_job()
+            if msg is None:
+                break
+            job_id, job = msg
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                _run_child(job, write_fd)
+
+            os.close(write_fd)
+            try:
+                os.setpgid(pid, pid)
+            except OSError:
+                pass  # the child already did it (or is gone)
+            running[read_fd] = (job_id, job, pid, [])
+            conn.send(("started", job_id, pid))
+
+        for ready in multiprocessing.connection.wait([conn, *running]):
+            if ready is conn:
+                msg = conn.recv()
+                if msg is None:
+                    return
+                pending.append(msg)
+                continue
+
+            job_id, job, pid, received = running[ready]
+            chunk = os.read(ready, 65536)
+            if chunk:
+                received.append(chunk)
+                continue
+
+            # EOF: the child has exited (or been killed)
+            os.close(ready)
+            os.waitpid(pid, 0)
+            del running[ready]
+            try:
+                result = pickle.loads(b"".join(received))
+            except (pickle.UnpicklingError, EOFError, ValueError):
+                # Nothing, or a result cut short: killed mid-write
+                result = {"scene": job["scene"], "cancelled": True}
+            conn.send(("done", job_id, result))
+
+
+class RenderDaemon:
+    """
+    Handle to the zygote process.
+
+    `submit` sends a job and returns
+    a `concurrent.futures.Future` that resolves to the child's result dict:
+
+        {"scene", "quality", "movie", "startup",
+         "render", "first_change", "stats"}       on success
+        {"scene", "error"}                        if the scene raised
+        {"scene", "cancelled"}                    if it was killed
+
+    A job is a dict with "file" and "scene", and optionally "source" (the
+    file contents to render), "quality" (a manim quality name), "nice"
+    (run at lower CPU priority, and only in spare slots) and "frame_workers"
+    (rasterize long play() calls on that many cores).
+
+    Up to `max_workers` renders (default: one per core) run side by side.
+    """
+
+    def __init__(self, cwd=".", max_workers=None):
+        ctx = multiprocessing.get_context("fork")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_zygote,
+            args=(child_conn, os.path.abspath(cwd), max_workers or os.cpu_count()),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        self._send_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._ids = itertools.count()
+        self._futures = {}
+        self._pids = {}
+        self._cancelled = set()
+        self._exited = False
+
+        # Blocks until manim is imported in the zygote
+        _, _, self.import_time = self._conn.recv()
+
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    def submit(self, job):
+        job_id = next(self._ids)
+        future = Future()
+        future.job_id = job_id
+        future.scene = job["scene"]
+        with self._state_lock:
+            if self._exited:
+                future.set_result(
+                    {"scene": job["scene"], "error": "the render daemon exited"}
+                )
+                return future
+            self._futures[job_id] = future
+        with self._send_lock:
+            self._conn.send((job_id, job))
+        return future
+
+    def cancel(self, future):
+        """Kill the render behind `future` (or drop it if it has not started)."""
+        job_id = future.job_id
+        with self._state_lock:
+            if job_id not in self._futures:
+                return
+            self._cancelled.add(job_id)
+            pid = self._pids.get(job_id)
+        if pid is not None:
+            self._kill(pid)
+
+    def close(self):
+        with self._send_lock:
+            self._conn.send(None)
+        self._process.join(timeout=5)
+
+    def _kill(self, pid):
+        # The child leads its own process group, so ffmpeg and the TeX
+        # compiler it spawned go down with it
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _listen(self):
+        while True:
+            try:
+                kind, job_id, payload = self._conn.recv()
+            except (EOFError, OSError):
+                self._fail_pending()
+                break
+
+            if kind == "started":
+                with self._state_lock:
+                    self._pids[job_id] = payload
+                    kill = job_id in self._cancelled
+                if kill:
+                    self._kill(payload)
+            elif kind == "done":
+                with self._state_lock:
+                    future = self._futures.pop(job_id)
+                    self._pids.pop(job_id, None)
+                    self._cancelled.discard(job_id)
+                future.set_result(payload)
+
+    def _fail_pending(self):
+        """The zygote is gone: resolve every future still waiting on it."""
+        with self._state_lock:
+            self._exited = True
+            futures, self._futures = self._futures, {}
+            self._pids.clear()
+            self._cancelled.clear()
+        for future in futures.values():
+            future.set_result(
+                {"scene": future.scene, "error": "the render daemon exited"}
+            )
@@ -0,0 +1,53 @@
+"""
+Held-frame deduplication.
+
+Within a `play()` call the static mobjects are already baked into the
+background, so a frame only differs from the previous one if a moving
+mobject (or the camera) changed. When the fingerprint of the moving
+mobjects matches the previous frame's, the previous frame, still sitting
+in the camera's pixel array, is written again without rasterizing anything.
+This covers the tails of animations whose rate function has settled and
+waits with updaters that do not change anything visible. Plain waits are
+already frozen frames in manim; we count those too.
+
+Counters per render: "rasterized", "reused" and "held" (frozen-wait frames).
+"""
+
+from animtools import fingerprint, stats
+
+
+def install():
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    original_render = CairoRenderer.render
+    original_save_static = CairoRenderer.save_static_frame_data
+    original_freeze = CairoRenderer.freeze_current_frame
+
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return original_render(self, scene, time, moving_mobjects)
+
+        key = fingerprint.frame_key(self.camera, moving_mobjects)
+        if key == getattr(self, "last_frame_key", None):
+            self.add_frame(self.get_frame())
+            stats.bump("frames", "reused")
+            return
+
+        original_render(self, scene, time, moving_mobjects)
+        self.last_frame_key = key
+        stats.bump("frames", "rasterized")
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # The pixel array is about to hold the new background, not a frame
+        self.last_frame_key = None
+        return original_save_static(self, scene, static_mobjects)
+
+    def freeze_current_frame(self, duration):
+        if not self.skip_animations:
+            stats.bump("frames", "held", int(duration * config.frame_rate))
+        return original_freeze(self, duration)
+
+    CairoRenderer.render = render
+    CairoRenderer.save_static_frame_data = save_static_frame_data
+    CairoRenderer.freeze_current_frame = freeze_current_frame
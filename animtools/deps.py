@@ -0,0 +1,183 @@
+"""
+Which scenes does an edit affect?
+
+We parse the scene module, give every top-level definition a hash of its
+AST (so comments and formatting do not count) and record which other
+top-level names it refers to. Scenes are the classes that end up deriving
+from a `...Scene` base. After a save, a scene is affected when anything in
+its transitive closure changed: its own body, a helper function or class,
+a base class (`RayleighJeansCatastrophe` -> `Introduction`), a constant, or a
+sibling module it imports, directly or through other sibling modules
+(`scene` -> `blackbody` -> `spectra`).
+
+Module-level statements that are not definitions (config and TeX template
+setup, gettext) are pooled into one "<module>" node that every scene
+depends on.
+"""
+
+import ast
+import hashlib
+from pathlib import Path
+
+MODULE = "<module>"
+
+
+def _digest(*parts):
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode())
+    return digest.hexdigest()
+
+
+def _bound_names(node):
+    """Top-level names a statement defines, or [] if it is plain module code."""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        if all(isinstance(target, ast.Name) for target in targets):
+            return [target.id for target in targets]
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        names = [alias.asname or alias.name.split(".")[0] for alias in node.names]
+        if "*" not in names:
+            return names
+    return []
+
+
+def _imported_modules(node):
+    """Absolute module names an import statement loads, [] for others."""
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+        return [node.module]
+    return []
+
+
+def _module_digest(path, digests):
+    """
+    Hash of a sibling module and every sibling module it imports, memoized
+    in `digests` (path -> hash, None while being hashed, for import cycles).
+    """
+    if path in digests:
+        return digests[path] or ""
+    digests[path] = None
+    source = path.read_bytes()
+    parts = [source]
+    try:
+        nodes = ast.walk(ast.parse(source))
+    except SyntaxError:
+        nodes = []  # its bytes still count
+    for node in nodes:
+        for module in _imported_modules(node):
+            sibling = _sibling(path, module)
+            if sibling is not None:
+                parts.append(_module_digest(sibling, digests))
+    digests[path] = _digest(*parts)
+    return digests[path]
+
+
+def _sibling(path, module):
+    sibling = path.parent / (module.replace(".", "/") + ".py")
+    return sibling if sibling.exists() else None
+
+
+def _referenced_names(node):
+    return {sub.id for sub in ast.walk(node) if isinstance(sub, ast.Name)}
+
+
+def _base_names(node):
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def analyse(path, source=None):
+    """
+    Parse a scene module, or `source` as the contents of `path`.
+
+    Returns:
+    --------
+    hashes : dict
+        name -> hash of everything that defines it
+    edges : dict
+        name -> set of top-level names it refers to
+    scenes : list
+        Scene class names, in file order
+    """
+    path = Path(path)
+    tree = ast.parse(path.read_text() if source is None else source)
+
+    parts = {}
+    edges = {}
+    classes = {}
+    digests = {path.resolve(): None}
+    for node in tree.body:
+        names = _bound_names(node) or [MODULE]
+        dump = ast.dump(node)
+
+        # Imports of sibling modules change when those files change
+        for sub in ast.walk(node):
+            for module in _imported_modules(sub):
+                sibling = _sibling(path, module)
+                if sibling is not None:
+                    dump += _module_digest(sibling.resolve(), digests)
+
+        for name in names:
+            parts.setdefault(name, []).append(dump)
+            edges.setdefault(name, set()).update(_referenced_names(node))
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = _base_names(node)
+
+    hashes = {name: _digest(*dumps) for name, dumps in parts.items()}
+    for name in edges:
+        edges[name] = {ref for ref in edges[name] if ref in hashes and ref != name}
+
+    def is_scene(name, seen=()):
+        for base in classes.get(name, []):
+            if base in classes and base not in seen:
+                if is_scene(base, (*seen, name)):
+                    return True
+            elif base.endswith("Scene"):
+                return True
+        return False
+
+    scenes = [name for name in classes if is_scene(name)]
+    return hashes, edges, scenes
+
+
+def closure(name, edges):
+    """Every top-level name `name` depends on, including itself."""
+    seen = {name, MODULE}
+    stack = [name, MODULE]
+    while stack:
+        for ref in edges.get(stack.pop(), ()):
+            if ref not in seen:
+                seen.add(ref)
+                stack.append(ref)
+    return seen
+
+
+class SceneGraph:
+    """Remembers the last analysis of a file and diffs new saves against it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.hashes = None
+
+    def update(self):
+        """Re-parse the file and return the scenes affected since last time."""
+        hashes, edges, scenes = analyse(self.path)
+        previous, self.hashes = self.hashes, hashes
+        if previous is None:
+            return scenes
+
+        changed = {
+            name
+            for name in hashes.keys() | previous.keys()
+            if hashes.get(name) != previous.get(name)
+        }
+        return [scene for scene in scenes if closure(scene, edges) & changed]
@@ -0,0 +1,109 @@
+"""
+Dirty-rectangle rendering for small moving mobjects.
+
+During a `play()` call the camera's pixel array still holds the previous
+frame when the next one is rendered. If the moving mobjects only cover a
+small part of the frame (a photon crossing the static apparatus, one circle
+sliding in `Collision`), we only need to repaint the union of where they
+were and where they are now: copy that rectangle back from the cached
+static background and redraw the moving mobjects with Cairo clipped to it.
+
+Anything that may move the whole picture (3D or moving cameras), glowing
+mobjects (their bloom spreads past their bounds) and frames where the dirty
+area is large fall back to full frames.
+"""
+
+import numpy as np
+
+from animtools import bloom, stats
+
+# Above this fraction of the frame a full repaint is just as cheap
+MAX_DIRTY_FRACTION = 0.5
+
+# Scene units added around the bounding boxes, for strokes and antialiasing
+PADDING = 0.1
+
+
+def _bounds(mobjects):
+    points = [
+        mob.points[:, :2]
+        for top in mobjects
+        for mob in top.get_family()
+        if len(mob.points)
+    ]
+    if not points:
+        return None
+    points = np.concatenate(points)
+    return points.min(axis=0), points.max(axis=0)
+
+
+def _pixel_box(camera, low, high):
+    """Scene-space box -> (x0, y0, x1, y1) pixel slice bounds, clipped."""
+    pw, ph = camera.pixel_width, camera.pixel_height
+    sx, sy = pw / camera.frame_width, ph / camera.frame_height
+    center = camera.frame_center
+
+    x0 = int(np.floor((low[0] - center[0]) * sx + pw / 2))
+    x1 = int(np.ceil((high[0] - center[0]) * sx + pw / 2))
+    # Pixel rows grow downwards
+    y0 = int(np.floor(ph / 2 - (high[1] - center[1]) * sy))
+    y1 = int(np.ceil(ph / 2 - (low[1] - center[1]) * sy))
+    return max(x0, 0), max(y0, 0), min(x1, pw), min(y1, ph)
+
+
+def install():
+    from manim.camera.camera import Camera
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    original_render = CairoRenderer.render
+    original_save_static = CairoRenderer.save_static_frame_data
+
+    def render(self, scene, time, moving_mobjects):
+        camera = self.camera
+        previous = getattr(self, "dirty_bounds", None)
+        current = None
+        if (
+            type(camera) is Camera
+            and not self.skip_animations
+            and not any(bloom.is_emissive(mob) for mob in moving_mobjects)
+        ):
+            current = _bounds(moving_mobjects)
+        self.dirty_bounds = current
+
+        if current is None or previous is None:
+            return original_render(self, scene, time, moving_mobjects)
+
+        low = np.minimum(current[0], previous[0]) - PADDING
+        high = np.maximum(current[1], previous[1]) + PADDING
+        x0, y0, x1, y1 = _pixel_box(camera, low, high)
+        area = max(x1 - x0, 0) * max(y1 - y0, 0)
+        if area > MAX_DIRTY_FRACTION * camera.pixel_width * camera.pixel_height:
+            stats.bump("dirty rects", "full frames")
+            return original_render(self, scene, time, moving_mobjects)
+
+        background = self.static_image
+        if background is None:
+            background = camera.background
+        camera.pixel_array[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+
+        # Same cached context the camera draws vector mobjects with
+        ctx = camera.get_cairo_context(camera.pixel_array)
+        ctx.save()
+        ctx.new_path()
+        ctx.rectangle(low[0], low[1], high[0] - low[0], high[1] - low[1])
+        ctx.clip()
+        try:
+            camera.capture_mobjects(moving_mobjects)
+        finally:
+            ctx.restore()
+
+        self.add_frame(self.get_frame())
+        stats.bump("dirty rects", "partial frames")
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # New play() call: the pixel array no longer holds the last frame
+        self.dirty_bounds = None
+        return original_save_static(self, scene, static_mobjects)
+
+    CairoRenderer.render = render
+    CairoRenderer.save_static_frame_data = save_static_frame_data
@@ -0,0 +1,76 @@
+"""
+Cheap fingerprints of what a mobject (or the camera) looks like.
+
+Hashing the arrays that feed the rasterizer is far cheaper than rasterizing
+them, so the render hooks use these to tell whether anything visible changed.
+"""
+
+import hashlib
+
+import numpy as np
+
+# Everything the Cairo camera reads when it draws a mobject
+_ARRAY_ATTRS = (
+    "points",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "rgbas",
+    "pixel_array",
+)
+_SCALAR_ATTRS = (
+    "stroke_width",
+    "background_stroke_width",
+    "sheen_factor",
+    "shade_in_3d",
+    "z_index",
+    "bloom",
+)
+
+
+def _update(digest, mob):
+    digest.update(type(mob).__name__.encode())
+    for attr in _ARRAY_ATTRS:
+        value = getattr(mob, attr, None)
+        if isinstance(value, np.ndarray):
+            digest.update(str(value.shape).encode())
+            digest.update(np.ascontiguousarray(value).data)
+    for attr in _SCALAR_ATTRS:
+        digest.update(repr(getattr(mob, attr, None)).encode())
+    direction = getattr(mob, "sheen_direction", None)
+    if direction is not None:
+        digest.update(np.asarray(direction, dtype=float).tobytes())
+
+
+def mobjects_state(mobjects, digest=None):
+    """Hash the families of `mobjects`, in drawing order."""
+    digest = digest or hashlib.blake2b(digest_size=16)
+    for top in mobjects:
+        for mob in top.get_family():
+            _update(digest, mob)
+    return digest
+
+
+def camera_state(camera, digest=None):
+    """Hash the parts of the camera that move things on screen."""
+    digest = digest or hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(camera.frame_center, dtype=float).tobytes())
+    # ThreeDCamera orientation
+    for getter in (
+        "get_phi",
+        "get_theta",
+        "get_gamma",
+        "get_focal_distance",
+        "get_zoom",
+    ):
+        if hasattr(camera, getter):
+            digest.update(repr(getattr(camera, getter)()).encode())
+    frame = getattr(camera, "frame", None)
+    if frame is not None:
+        _update(digest, frame)
+    return digest
+
+
+def frame_key(camera, mobjects):
+    """Fingerprint of a frame made of `mobjects` seen through `camera`."""
+    return mobjects_state(mobjects, camera_state(camera)).hexdigest()
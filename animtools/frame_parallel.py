@@ -0,0 +1,129 @@
+"""
+Rasterize the frames of one long `play()` call on several cores.
+
+Interpolating an animation at a given time only depends on the state the
+scene had when the call started, as long as nothing in the scene has an
+updater. So at the start of a long call we fork a worker per chunk of the
+frame range: each worker inherits the scene exactly as it is, moves to its
+first frame, rasterizes its chunk with Cairo and dumps the raw frames to a
+temporary file. The parent then feeds the chunks to the movie writer in
+order, so the partial movie comes out the same as a serial render.
+
+Calls with updaters, a stop condition or only a few frames take the normal
+serial path.
+"""
+
+import os
+import tempfile
+import traceback
+
+import numpy as np
+
+from animtools import stats
+
+# Below this many frames per worker, forking costs more than it saves
+MIN_FRAMES_PER_WORKER = 8
+
+
+def _has_updaters(scene):
+    if scene.updaters:
+        return True
+    # A suspended mobject only updates again once resumed. Within a call that
+    # happens when an animation of its family finishes: Animation.finish
+    # resumes its mobject, and Succession finishes each part as the next
+    # starts. Those count; suspended mobjects nothing animates stay still.
+    animated = set()
+    for animation in scene.animations:
+        if animation.mobject is not None:
+            animated.update(map(id, animation.mobject.get_family()))
+    return any(
+        mob.updaters and (not mob.updating_suspended or id(mob) in animated)
+        for top in scene.mobjects
+        for mob in top.get_family()
+    )
+
+
+def _rasterize_chunk(scene, times, path):
+    renderer = scene.renderer
+    with open(path, "wb") as f:
+        for t in times:
+            scene.update_to_time(t)
+            renderer.update_frame(scene, scene.moving_mobjects)
+            renderer.get_frame().tofile(f)
+
+
+def _play_parallel(scene, times, workers):
+    renderer = scene.renderer
+    chunks = np.array_split(times, workers)
+    frame_shape = renderer.get_frame().shape
+
+    with tempfile.TemporaryDirectory(prefix="animtools-frames-") as tmp:
+        children = []
+        for index, chunk in enumerate(chunks):
+            path = os.path.join(tmp, f"{index}.raw")
+            pid = os.fork()
+            if pid == 0:
+                code = 0
+                try:
+                    _rasterize_chunk(scene, chunk, path)
+                except BaseException:
+                    traceback.print_exc()
+                    code = 1
+                finally:
+                    os._exit(code)
+            children.append((pid, path, len(chunk)))
+
+        for pid, path, count in children:
+            _, status = os.waitpid(pid, 0)
+            if os.waitstatus_to_exitcode(status) != 0:
+                raise RuntimeError("frame worker failed")
+            frames = np.memmap(
+                path, dtype=np.uint8, mode="r", shape=(count, *frame_shape)
+            )
+            for frame in frames:
+                renderer.add_frame(np.array(frame))
+            del frames
+            os.unlink(path)
+
+    # Bring the parent's scene to where the serial loop would have left it
+    scene.update_to_time(times[-1])
+    stats.bump("frame parallel", "plays")
+    stats.bump("frame parallel", "frames", len(times))
+
+
+def install(workers=None):
+    """Make long `play()` calls rasterize on `workers` cores (default: all)."""
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene import Scene
+
+    workers = workers or os.cpu_count()
+    original_play_internal = Scene.play_internal
+
+    def play_internal(self, skip_rendering=False):
+        duration = self.get_run_time(self.animations)
+        times = np.arange(0, duration, 1 / config.frame_rate)
+
+        if (
+            skip_rendering
+            or self.skip_animation_preview
+            or self.renderer.skip_animations
+            or not isinstance(self.renderer, CairoRenderer)
+            or self.stop_condition is not None
+            or len(times) < 2 * MIN_FRAMES_PER_WORKER
+            or _has_updaters(self)
+        ):
+            return original_play_internal(self, skip_rendering)
+
+        self.duration = duration
+        _play_parallel(self, times, min(workers, len(times) // MIN_FRAMES_PER_WORKER))
+
+        # Same wrap-up as Scene.play_internal
+        for animation in self.animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        if not self.renderer.skip_animations:
+            self.update_mobjects(0)
+        self.renderer.static_image = None
+
+    Scene.play_internal = play_internal
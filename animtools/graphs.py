@@ -0,0 +1,241 @@
+"""
+Function graphs sampled in NumPy.
+
+For graphs that are smooth everywhere, `axes.plot(function,
+use_vectorized=True)` already evaluates the function once on all samples;
+`sample_range` and `coords_to_points` do the same sampling and mapping for
+code that builds points itself (`BlackbodyCurve`).
+
+`plot_adaptive(axes, function)` is for graphs that are flat in places and
+steep in others, like the Rayleigh-Jeans law as the wavelength goes to 0.
+It starts from one sample per x tick and bisects, in NumPy, only the
+intervals where the graph strays from the straight line between samples by
+more than `TOLERANCE` on screen. The graph is cut where it leaves the axes'
+y range, at the crossing found by bisection.
+"""
+
+import numpy as np
+
+# Same density as Axes.plot: samples per x tick
+SAMPLES_PER_TICK = 10
+
+# Largest distance, in scene units, between an adaptive graph and the line
+# through neighbouring samples: about half a pixel at 1080p
+TOLERANCE = 0.004
+
+
+def supports_arrays(function, sample):
+    """
+    Whether `function` evaluates an array argument element-wise.
+
+    Parameters:
+    -----------
+    function : callable
+        Function of one float
+    sample : array
+        A few points of its domain to try it on
+    """
+    sample = np.asarray(sample, dtype=float)
+    with np.errstate(all="ignore"):
+        try:
+            values = function(sample)
+            expected = np.array([function(x) for x in sample], dtype=float)
+        except Exception:
+            return False
+    return (
+        isinstance(values, np.ndarray)
+        and values.shape == sample.shape
+        and np.allclose(values, expected, equal_nan=True)
+    )
+
+
+def vectorized(function, sample):
+    """`function` as a function of arrays, looping only if it must."""
+    if supports_arrays(function, sample):
+        return lambda xs: np.asarray(function(xs), dtype=float)
+    return lambda xs: np.array([function(x) for x in xs], dtype=float)
+
+
+def coords_to_points(axes, xs, ys):
+    """`axes.coords_to_point` over arrays, exact for linear axes."""
+    from manim.mobject.graphing.scale import LinearBase
+
+    linear = all(
+        type(axis.scaling) is LinearBase for axis in (axes.x_axis, axes.y_axis)
+    )
+    if not linear:
+        return np.array([axes.coords_to_point(x, y) for x, y in zip(xs, ys)])
+
+    origin = np.asarray(axes.coords_to_point(0, 0))
+    unit_x = np.asarray(axes.coords_to_point(1, 0)) - origin
+    unit_y = np.asarray(axes.coords_to_point(0, 1)) - origin
+    return origin + np.outer(xs, unit_x) + np.outer(ys, unit_y)
+
+
+def sample_range(axes, x_range=None, samples_per_tick=SAMPLES_PER_TICK):
+    """The x samples `Axes.plot` would use for `x_range`."""
+    t_range = np.array(axes.x_range, dtype=float)
+    if x_range is not None:
+        t_range[: len(x_range)] = x_range
+    if x_range is None or len(x_range) < 3:
+        t_range[2] /= samples_per_tick
+    x_min, x_max, step = t_range
+    return np.append(np.arange(x_min, x_max, step), x_max)
+
+
+def _refine(function, xs, ys, y_range, to_screen, tolerance, max_rounds):
+    """Bisect the intervals whose midpoint strays from the chord on screen."""
+    y_min, y_max = y_range
+
+    def screen(xs, ys):
+        return to_screen(xs, np.clip(ys, y_min, y_max))
+
+    pending = np.ones(len(xs) - 1, dtype=bool)
+    for _ in range(max_rounds):
+        index = np.flatnonzero(pending)
+        if not len(index):
+            break
+        mids = (xs[index] + xs[index + 1]) / 2
+        mid_ys = function(mids)
+        chords = (
+            screen(xs[index], ys[index]) + screen(xs[index + 1], ys[index + 1])
+        ) / 2
+        with np.errstate(invalid="ignore"):
+            error = np.linalg.norm(screen(mids, mid_ys) - chords, axis=1)
+            split = index[error > tolerance]
+
+        # Both halves of a split interval are checked in the next round
+        pending[:] = False
+        pending[split] = True
+        pending = np.insert(pending, split + 1, True)
+        keep = np.isin(index, split)
+        xs = np.insert(xs, split + 1, mids[keep])
+        ys = np.insert(ys, split + 1, mid_ys[keep])
+    return xs, ys
+
+
+def _crossings(function, y_range, inside_x, outside_x, iterations=50):
+    """Where the graph leaves the y range between each pair, by bisection."""
+    y_min, y_max = y_range
+    for _ in range(iterations):
+        mids = (inside_x + outside_x) / 2
+        with np.errstate(invalid="ignore"):
+            ys = function(mids)
+            inside = (ys >= y_min) & (ys <= y_max)
+        inside_x = np.where(inside, mids, inside_x)
+        outside_x = np.where(inside, outside_x, mids)
+    return inside_x, np.clip(function(inside_x), y_min, y_max)
+
+
+def sample_adaptively(
+    function, xs, y_range, to_screen, tolerance=TOLERANCE, max_rounds=20
+):
+    """
+    `adaptive_samples` for any mapping to the screen, NumPy only.
+
+    Parameters:
+    -----------
+    function : callable
+        Function of one float, preferably evaluating arrays element-wise
+    xs : array
+        Initial samples, in increasing order
+    y_range : tuple
+        (y_min, y_max) the graph is cut to
+    to_screen : callable
+        to_screen(xs, ys), the points of the samples on screen, one row each
+    tolerance : float
+        Largest distance from the graph, in scene units
+    max_rounds : int
+        Most times an interval between initial samples is halved
+
+    Returns:
+    --------
+    list of (xs, ys)
+        One pair of arrays per stretch of the graph inside the y range
+    """
+    y_min, y_max = y_range
+    xs = np.asarray(xs, dtype=float)
+    function = vectorized(function, xs[[0, len(xs) // 2, -1]])
+    with np.errstate(all="ignore"):
+        ys = function(xs)
+        xs, ys = _refine(function, xs, ys, y_range, to_screen, tolerance, max_rounds)
+        inside = (ys >= y_min) & (ys <= y_max)
+
+        # Samples either side of each point where the graph leaves the range
+        edges = np.flatnonzero(inside[:-1] != inside[1:])
+        enters = ~inside[edges]
+        inner = np.where(enters, edges + 1, edges)
+        outer = np.where(enters, edges, edges + 1)
+        cross_x, cross_y = _crossings(function, y_range, xs[inner], xs[outer])
+
+    runs = []
+    ends = dict(zip(edges, zip(cross_x, cross_y)))
+    starts = np.flatnonzero(inside & ~np.append(False, inside[:-1]))
+    stops = np.flatnonzero(inside & ~np.append(inside[1:], False))
+    for start, stop in zip(starts, stops):
+        run_x, run_y = [xs[start : stop + 1]], [ys[start : stop + 1]]
+        if start - 1 in ends:
+            run_x.insert(0, [ends[start - 1][0]])
+            run_y.insert(0, [ends[start - 1][1]])
+        if stop in ends:
+            run_x.append([ends[stop][0]])
+            run_y.append([ends[stop][1]])
+        runs.append((np.concatenate(run_x), np.concatenate(run_y)))
+    return runs
+
+
+def adaptive_samples(axes, function, x_range=None, tolerance=TOLERANCE, max_rounds=20):
+    """
+    Samples of `function` that keep the polyline through them within
+    `tolerance` of its graph on screen, cut to the axes' y range.
+
+    Parameters:
+    -----------
+    axes : Axes
+        Axes the graph is drawn on
+    function : callable
+        Function of one float, preferably evaluating arrays element-wise
+    x_range : list
+        [x_min, x_max], the axes' x range by default
+    tolerance : float
+        Largest distance from the graph, in scene units
+    max_rounds : int
+        Most times an interval between x ticks is halved
+
+    Returns:
+    --------
+    list of (xs, ys)
+        One pair of arrays per stretch of the graph inside the y range
+    """
+    return sample_adaptively(
+        function,
+        sample_range(axes, x_range, samples_per_tick=1),
+        axes.y_range[:2],
+        lambda xs, ys: coords_to_points(axes, xs, ys),
+        tolerance,
+        max_rounds,
+    )
+
+
+def plot_adaptive(axes, function, x_range=None, tolerance=TOLERANCE, **kwargs):
+    """
+    Like `axes.plot(function, x_range, **kwargs)`, but with samples only as
+    dense as the graph needs (see `adaptive_samples`), drawn as straight
+    segments and cut where it leaves the axes.
+
+    Returns:
+    --------
+    VMobject
+        The graph, with `underlying_function` set like `Axes.plot` does
+    """
+    from manim import VMobject
+
+    graph = VMobject(**kwargs)
+    for xs, ys in adaptive_samples(axes, function, x_range, tolerance):
+        if len(xs) < 2:
+            continue
+        # Runs do not touch, so each one is its own subpath
+        run = VMobject().set_points_as_corners(coords_to_points(axes, xs, ys))
+        graph.append_points(run.points)
+    graph.underlying_function = function
+    return graph
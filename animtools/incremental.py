@@ -0,0 +1,78 @@
+"""
+Segment-level incremental re-rendering for watch mode.
+
+Manim fingerprints every `play`/`wait` call (the animations' arguments plus
+the state of every mobject in the scene) and writes one partial movie per
+fingerprint. We keep every partial around, record the ordered fingerprints
+of each render in a manifest next to them, and compare against the previous
+render: unchanged calls reuse their partial movie, the rest are rebuilt, and
+the final movie is concatenated with stream copy as usual.
+
+The manifest also tells us where the first changed call starts, so the
+preview can jump straight to it.
+"""
+
+import json
+from pathlib import Path
+
+from animtools import stats
+
+MANIFEST = "segments.json"
+
+# Enough partial movies to hold a few revisions of our longest scenes; manim's
+# default of 100 makes `Introduction` evict its own segments mid-render.
+MAX_FILES_CACHED = 2000
+
+
+def install():
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    config.disable_caching = False
+    config.flush_cache = False
+    config.max_files_cached = MAX_FILES_CACHED
+
+    original_play = CairoRenderer.play
+
+    def play(self, scene, *args, **kwargs):
+        if not hasattr(self, "segments"):
+            self.segments = []
+
+        start = self.time
+        original_play(self, scene, *args, **kwargs)
+
+        hash_ = self.animations_hashes[-1]
+        if hash_ is None:
+            # Skipped on purpose (e.g. rendering from a later animation)
+            return
+        reused = self.skip_animations and not self._original_skipping_status
+        self.segments.append({"hash": hash_, "start": start})
+        stats.bump("segments", "reused" if reused else "rebuilt")
+
+    CairoRenderer.play = play
+
+
+def finish(scene, name=None):
+    """
+    Save this render's manifest and return the start time (in seconds) of
+    the first call that differs from the previous render, or None. Renders
+    that share a partial movie directory but are compared separately (one
+    per locale) pass their own manifest `name`.
+    """
+    renderer = scene.renderer
+    segments = getattr(renderer, "segments", [])
+    directory = getattr(renderer.file_writer, "partial_movie_directory", None)
+    if directory is None:
+        return None
+
+    manifest = Path(directory) / (f"segments-{name}.json" if name else MANIFEST)
+    previous = []
+    if manifest.exists():
+        previous = json.loads(manifest.read_text())
+    manifest.write_text(json.dumps([seg["hash"] for seg in segments]))
+
+    for index, seg in enumerate(segments):
+        if index >= len(previous) or previous[index] != seg["hash"]:
+            stats.bump("segments", "first changed", index)
+            return seg["start"]
+    return None
@@ -0,0 +1,99 @@
+"""
+Preview renders in one long-lived mpv window.
+
+Instead of `pkill mpv` and a new window per render, we start mpv once with a
+JSON IPC socket and tell it to `loadfile` each new movie, starting at the
+first animation that changed.
+"""
+
+import itertools
+import json
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+
+
+class MpvPreview:
+    def __init__(self, socket_path=None):
+        self.socket_path = socket_path or os.path.join(
+            tempfile.gettempdir(), f"animtools-mpv-{os.getpid()}.sock"
+        )
+        self.current = None
+        self._process = None
+        self._sock = None
+        self._buffer = b""
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def show(self, movie, start=None):
+        """Play `movie` from `start` seconds (or from the beginning)."""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._launch()
+
+            # `start` is an option, so setting it applies to the next loadfile
+            self._command("set_property", "start", f"{start or 0:.3f}")
+            self._command("loadfile", str(movie), "replace")
+            self.current = str(movie)
+
+    def position(self):
+        """Playback position in seconds, or None if nothing is playing."""
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                return None
+            return self._command("get_property", "time-pos")
+
+    def close(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+
+    def _launch(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        # Format: --geometry=<width>x<height>+<x>+<y>
+        self._process = subprocess.Popen(
+            [
+                "mpv",
+                "--idle=yes",
+                "--loop",
+                "--force-window=yes",
+                "--geometry=50%+100%+100%",
+                "--autofit=40%",
+                "--focus-on=never",
+                f"--input-ipc-server={self.socket_path}",
+            ]
+        )
+
+        deadline = time.monotonic() + 5
+        while not os.path.exists(self.socket_path):
+            if time.monotonic() > deadline:
+                raise RuntimeError("mpv did not open its IPC socket")
+            time.sleep(0.05)
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.connect(self.socket_path)
+        self._sock.settimeout(2)
+        self._buffer = b""
+
+    def _command(self, *args):
+        request_id = next(self._ids)
+        msg = {"command": list(args), "request_id": request_id}
+        self._sock.sendall(json.dumps(msg).encode() + b"\n")
+
+        # Read until our reply, dropping the events mpv sends in between
+        while True:
+            while b"\n" not in self._buffer:
+                chunk = self._sock.recv(4096)
+                if not chunk:
+                    raise ConnectionError("mpv closed its IPC socket")
+                self._buffer += chunk
+            line, self._buffer = self._buffer.split(b"\n", 1)
+            reply = json.loads(line)
+            if reply.get("request_id") == request_id:
+                if reply.get("error") != "success":
+                    print(f"[preview] mpv {args[0]}: {reply.get('error')}")
+                return reply.get("data")
@@ -0,0 +1,152 @@
+"""
+Coalesce file events into renders.
+
+Editors often emit several modify events for a single save, and a long scene
+can still be rendering when the next save lands. `RenderQueue` waits for the
+events to settle (debounce), drops saves that did not change any source
+(content hash), and kills a scene's in-flight render when a newer revision
+of that scene arrives. Renders of scenes the save did not affect carry on.
+
+A finished render can schedule a follow-up render of the same revision (the
+background high-quality pass); it is cancelled together with the draft when
+the scene changes again.
+"""
+
+import hashlib
+import threading
+import time
+import traceback
+from pathlib import Path
+
+
+def source_digest(directory):
+    """
+    Hash every `.py` file in `directory`, so helper modules count too.
+
+    Hidden files (editor locks like `.#scene.py`) and files that vanish or
+    cannot be read mid-save are left out.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(Path(directory).glob("*.py")):
+        if path.name.startswith("."):
+            continue
+        try:
+            source = path.read_bytes()
+        except OSError:
+            continue
+        digest.update(path.name.encode())
+        digest.update(source)
+    return digest.hexdigest()
+
+
+class RenderQueue:
+    """
+    Single worker between the watchdog thread and the render daemon.
+
+    Parameters:
+    -----------
+    daemon : RenderDaemon
+        Where the renders run
+    make_jobs : callable
+        Returns the job dicts to submit for the current sources, one per
+        scene that needs re-rendering
+    on_result : callable
+        Called with the result dict of every render that was not superseded
+    directory : str
+        Directory whose `.py` files make up a source revision
+    debounce : float
+        Seconds without events before a render is started
+    follow_up : callable or None
+        Given a finished job, returns the job to run next for the same
+        revision, or None
+    """
+
+    def __init__(
+        self,
+        daemon,
+        make_jobs,
+        on_result,
+        directory=".",
+        debounce=0.3,
+        follow_up=None,
+    ):
+        self.daemon = daemon
+        self.make_jobs = make_jobs
+        self.on_result = on_result
+        self.directory = directory
+        self.debounce = debounce
+        self.follow_up = follow_up
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._last_event = 0.0
+        self._digest = None
+        self._current = {}  # scene -> futures for its latest revision
+
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def notify(self):
+        """Record a file event; cheap enough to call from the watchdog thread."""
+        with self._lock:
+            self._last_event = time.monotonic()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+
+            # Wait until the editor has stopped writing
+            while True:
+                with self._lock:
+                    remaining = self._last_event + self.debounce - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(remaining)
+            self._wake.clear()
+
+            # The next save must still render, whatever went wrong with this one
+            try:
+                self._render()
+            except Exception:
+                print(f"[queue] render not started:\n{traceback.format_exc()}")
+
+    def _render(self):
+        digest = source_digest(self.directory)
+        if digest == self._digest:
+            print("[queue] sources unchanged, skipping render")
+            return
+
+        for job in self.make_jobs():
+            scene = job["scene"]
+            with self._lock:
+                stale = self._current.pop(scene, [])
+            for future in stale:
+                if not future.done():
+                    print(f"[queue] newer save, cancelling the running {scene}")
+                    self.daemon.cancel(future)
+            self._submit(job)
+        self._digest = digest
+
+    def _submit(self, job, after=None):
+        with self._lock:
+            revision = self._current.setdefault(job["scene"], [])
+            if after is not None and after not in revision:
+                return  # a newer save came in while `after` was finishing
+            future = self.daemon.submit(job)
+            future.job = job
+            revision.append(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future):
+        result = future.result()
+        with self._lock:
+            superseded = future not in self._current.get(result["scene"], [])
+        if superseded:
+            return
+
+        self.on_result(result)
+        if self.follow_up is not None and "movie" in result:
+            job = self.follow_up(future.job)
+            if job is not None:
+                self._submit(job, after=future)
@@ -0,0 +1,53 @@
+"""
+Keep the static background layer across `play()` calls.
+
+At the start of each `play()` manim rasterizes every mobject that the
+animations do not touch into `renderer.static_image`, and throws it away at
+the end of the call. In a section like the temperature sweep of
+`Introduction` the axes, spectrum and labels are the same for dozens of
+calls, so we remember the last few backgrounds keyed by which mobjects are
+static and what they look like, and reuse one when the key matches.
+
+Counters per render: "hits" and "misses".
+"""
+
+import collections
+
+from animtools import fingerprint, stats
+
+# Backgrounds kept per renderer; scenes tend to alternate between a few
+MAX_ENTRIES = 4
+
+
+def _key(camera, static_mobjects):
+    digest = fingerprint.camera_state(camera)
+    digest.update(repr([id(mob) for mob in static_mobjects]).encode())
+    digest.update(repr(camera.pixel_array.shape).encode())
+    return fingerprint.mobjects_state(static_mobjects, digest).hexdigest()
+
+
+def install():
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    original_save_static = CairoRenderer.save_static_frame_data
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        if self.skip_animations or not static_mobjects:
+            return original_save_static(self, scene, static_mobjects)
+
+        cache = self.__dict__.setdefault("static_cache", collections.OrderedDict())
+        key = _key(self.camera, static_mobjects)
+        if key in cache:
+            cache.move_to_end(key)
+            self.static_image = cache[key]
+            stats.bump("static layer", "hits")
+            return self.static_image
+
+        image = original_save_static(self, scene, static_mobjects)
+        cache[key] = image
+        if len(cache) > MAX_ENTRIES:
+            cache.popitem(last=False)
+        stats.bump("static layer", "misses")
+        return image
+
+    CairoRenderer.save_static_frame_data = save_static_frame_data
@@ -0,0 +1,29 @@
+"""
+Counters filled by the render hooks and printed by the watcher.
+
+Each render runs in its own forked child, so the counters start empty for
+every render and are shipped back with the result.
+"""
+
+from collections import Counter, defaultdict
+
+_counters = defaultdict(Counter)
+
+
+def bump(section, key, amount=1):
+    _counters[section][key] += amount
+
+
+def snapshot():
+    return {section: dict(counter) for section, counter in _counters.items()}
+
+
+def format_snapshot(snap):
+    lines = []
+    for section, counter in sorted(snap.items()):
+        values = ", ".join(
+            f"{key} {value:.2f}" if isinstance(value, float) else f"{key} {value}"
+            for key, value in counter.items()
+        )
+        lines.append(f"[{section}] {values}")
+    return "\n".join(lines)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from animtools import bloom
+
+
+def test_blur_keeps_the_light():
+    image = np.zeros((41, 41, 3), dtype=np.float32)
+    image[20, 20] = 255
+    blurred = bloom._gaussian_blur(image, 2.0)
+    np.testing.assert_allclose(blurred.sum(axis=(0, 1)), 255, rtol=1e-5)
+    assert blurred[20, 20, 0] == blurred.max()
+    np.testing.assert_allclose(blurred, blurred[::-1, ::-1], atol=1e-5)
+
+
+def test_wait_frames_glow_like_animated_frames():
+    manim = pytest.importorskip("manim")
+    frames = []
+
+    class StillGlow(manim.Scene):
+        def construct(self):
+            self.renderer.add_frame = lambda frame, num_frames=1: frames.append(
+                frame.copy()
+            )
+            dot = bloom.tag(manim.Dot(manim.LEFT * 3, color=manim.YELLOW))
+            square = manim.Square(1).shift(manim.RIGHT * 3)
+            self.add(dot, square)
+            # The dot is part of the static image, only the square moves
+            self.play(square.animate.set_color(manim.RED), run_time=0.5)
+            self.wait(0.5)
+
+    options = {"quality": "low_quality", "write_to_movie": False}
+    with manim.tempconfig({**options, "disable_caching": True}):
+        StillGlow().render()
+
+    animated, waiting = frames[-2], frames[-1]
+    assert waiting[..., :3].max() > 0
+    np.testing.assert_allclose(waiting, animated, atol=1)
@@ -0,0 +1,141 @@
+import textwrap
+
+from animtools import deps
+
+SCENES = """
+from manim import *
+from helpers import glow
+
+config.background_color = GRAY_E
+RADIUS = 2
+
+
+def make_circle():
+    return Circle(RADIUS)
+
+
+class Intro(ThreeDScene):
+    def construct(self):
+        self.add(make_circle())
+
+
+class Followup(Intro):
+    def construct(self):
+        super().construct()
+
+
+class Other(Scene):
+    def construct(self):
+        self.add(glow())
+
+
+class NotAScene(VGroup):
+    pass
+"""
+
+
+def write(path, source):
+    path.write_text(textwrap.dedent(source))
+
+
+def edit(path, old, new):
+    source = path.read_text()
+    assert old in source
+    path.write_text(source.replace(old, new))
+
+
+def watched(tmp_path):
+    write(tmp_path / "helpers.py", "def glow():\n    return None\n")
+    scene_file = tmp_path / "scene.py"
+    write(scene_file, SCENES)
+    graph = deps.SceneGraph(scene_file)
+    assert graph.update() == ["Intro", "Followup", "Other"]
+    return scene_file, graph
+
+
+def test_finds_scenes_through_base_classes(tmp_path):
+    scene_file, _ = watched(tmp_path)
+    _, edges, scenes = deps.analyse(scene_file)
+    assert scenes == ["Intro", "Followup", "Other"]
+    assert deps.closure("Followup", edges) >= {"Followup", "Intro", "make_circle"}
+    assert "make_circle" not in deps.closure("Other", edges)
+
+
+def test_comments_and_formatting_do_not_count(tmp_path):
+    scene_file, graph = watched(tmp_path)
+    edit(
+        scene_file,
+        "        self.add(glow())",
+        "        # glow it\n\n        self.add( glow() )",
+    )
+    assert graph.update() == []
+
+
+def test_helper_change_affects_its_users_and_subclasses(tmp_path):
+    scene_file, graph = watched(tmp_path)
+    edit(scene_file, "return Circle(RADIUS)", "return Square(RADIUS)")
+    assert graph.update() == ["Intro", "Followup"]
+
+
+def test_constant_change_follows_references(tmp_path):
+    scene_file, graph = watched(tmp_path)
+    edit(scene_file, "RADIUS = 2", "RADIUS = 3")
+    assert graph.update() == ["Intro", "Followup"]
+
+
+def test_subclass_change_leaves_base_alone(tmp_path):
+    scene_file, graph = watched(tmp_path)
+    edit(
+        scene_file,
+        "        super().construct()",
+        "        super().construct()\n        self.wait()",
+    )
+    assert graph.update() == ["Followup"]
+
+
+def test_module_code_affects_every_scene(tmp_path):
+    scene_file, graph = watched(tmp_path)
+    edit(scene_file, "GRAY_E", "BLACK")
+    assert graph.update() == ["Intro", "Followup", "Other"]
+
+
+def test_sibling_module_change_affects_importers(tmp_path):
+    _, graph = watched(tmp_path)
+    write(tmp_path / "helpers.py", "def glow():\n    return 1\n")
+    assert graph.update() == ["Other"]
+
+
+def test_plain_imports_and_imports_of_siblings_count(tmp_path):
+    write(tmp_path / "spectra.py", "C = 1\n")
+    write(tmp_path / "curves.py", "import spectra\n")
+    write(tmp_path / "colors.py", "from curves import *\n")
+    scene_file = tmp_path / "scene.py"
+    write(
+        scene_file,
+        """
+        from manim import *
+        import colors
+        import curves
+
+
+        class Graph(Scene):
+            def construct(self):
+                curves.plot()
+
+
+        class Glow(Scene):
+            def construct(self):
+                colors.glow()
+
+
+        class Title(Scene):
+            pass
+        """,
+    )
+    graph = deps.SceneGraph(scene_file)
+    assert graph.update() == ["Graph", "Glow", "Title"]
+
+    write(tmp_path / "colors.py", "from curves import plot\n")
+    assert graph.update() == ["Glow"]
+    write(tmp_path / "spectra.py", "C = 2\n")
+    assert graph.update() == ["Graph", "Glow"]
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from animtools import frame_parallel, stats
+
+
+class Mob:
+    def __init__(self, *children, updaters=(), suspended=False):
+        self.children = children
+        self.updaters = list(updaters)
+        self.updating_suspended = suspended
+
+    def get_family(self):
+        return [self, *(mob for child in self.children for mob in child.get_family())]
+
+
+class Animation:
+    def __init__(self, mobject):
+        self.mobject = mobject
+
+
+class Scene:
+    def __init__(self, mobjects, animations, updaters=()):
+        self.mobjects = mobjects
+        self.animations = animations
+        self.updaters = list(updaters)
+
+
+def grow(mob, dt):
+    mob.scale(1 + dt)
+
+
+def test_suspended_updaters_count_only_if_an_animation_may_resume_them():
+    dot = Mob(updaters=[grow], suspended=True)
+    square = Mob()
+    group = Mob(dot, square)
+
+    assert not frame_parallel._has_updaters(Scene([group], [Animation(square)]))
+    assert frame_parallel._has_updaters(Scene([group], [Animation(dot)]))
+    assert frame_parallel._has_updaters(Scene([group], [Animation(group)]))
+    assert frame_parallel._has_updaters(Scene([group], [Animation(None)], [grow]))
+
+    dot.updating_suspended = False
+    assert frame_parallel._has_updaters(Scene([group], [Animation(square)]))
+
+
+def render_frames(construct, workers=None):
+    """Every frame `construct` renders, on `workers` cores or serially."""
+    from manim import Scene, tempconfig
+
+    frames = []
+
+    class Frames(Scene):
+        def construct(self):
+            self.renderer.add_frame = lambda frame, num_frames=1: frames.extend(
+                [frame.copy()] * num_frames
+            )
+            construct(self)
+
+    options = {"quality": "low_quality", "write_to_movie": False}
+    with tempconfig({**options, "disable_caching": True, "save_last_frame": False}):
+        if workers:
+            frame_parallel.install(workers)
+        Frames().render()
+    return frames
+
+
+@pytest.fixture
+def restore_play():
+    manim = pytest.importorskip("manim")
+    original = manim.Scene.play_internal
+    yield
+    manim.Scene.play_internal = original
+
+
+def still_dot(scene):
+    from manim import Dot, Rotate, Square
+
+    dot = Dot().add_updater(grow)
+    square = Square()
+    scene.add(dot, square)
+    dot.suspend_updating()
+    scene.play(Rotate(square), run_time=4)
+
+
+def resumed_dot(scene):
+    from manim import Dot, Indicate, Rotate, Square, Succession
+
+    dot = Dot().add_updater(grow)
+    square = Square()
+    scene.add(dot, square)
+    dot.suspend_updating()
+    # Indicate resumes the dot halfway, in the middle of a worker's chunk
+    scene.play(Succession(Indicate(dot), Rotate(square)), run_time=4)
+
+
+@pytest.mark.parametrize(
+    "construct, parallel", [(still_dot, True), (resumed_dot, False)]
+)
+def test_workers_match_serial_frames(restore_play, construct, parallel):
+    serial = render_frames(construct)
+    plays = stats.snapshot().get("frame parallel", {}).get("plays", 0)
+    chunked = render_frames(construct, workers=3)
+
+    assert (
+        stats.snapshot().get("frame parallel", {}).get("plays", 0) == plays + parallel
+    )
+    assert len(chunked) == len(serial)
+    for serial_frame, chunked_frame in zip(serial, chunked):
+        np.testing.assert_array_equal(chunked_frame, serial_frame)
@@ -0,0 +1,83 @@
+import os
+import threading
+from concurrent.futures import Future
+
+from animtools import render_queue
+
+
+class Daemon:
+    """Finishes every job as soon as it is submitted."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+        future = Future()
+        future.set_result({"scene": job["scene"], "movie": "scene.mp4"})
+        return future
+
+    def cancel(self, future):
+        pass
+
+
+def rendering(tmp_path, make_jobs):
+    rendered = threading.Semaphore(0)
+    queue = render_queue.RenderQueue(
+        Daemon(),
+        make_jobs,
+        lambda result: rendered.release(),
+        directory=tmp_path,
+        debounce=0.01,
+    )
+    return queue, rendered
+
+
+def save(tmp_path, queue, source):
+    (tmp_path / "scene.py").write_text(source)
+    queue.notify()
+
+
+def test_digest_skips_hidden_and_unreadable_files(tmp_path):
+    (tmp_path / "scene.py").write_text("x = 1")
+    digest = render_queue.source_digest(tmp_path)
+
+    # A dangling editor lock, as Emacs leaves next to the file it edits
+    os.symlink(tmp_path / "gone.py", tmp_path / ".#scene.py")
+    os.symlink(tmp_path / "gone.py", tmp_path / "broken.py")
+    assert render_queue.source_digest(tmp_path) == digest
+
+
+def test_failing_job_build_does_not_stop_later_saves(tmp_path):
+    failures = [RuntimeError("first save")]
+
+    def make_jobs():
+        if failures:
+            raise failures.pop()
+        return [{"scene": "Intro"}]
+
+    queue, rendered = rendering(tmp_path, make_jobs)
+    save(tmp_path, queue, "x = 1")
+    assert not rendered.acquire(timeout=0.5)
+
+    # The same sources again: the failed save did not count as rendered
+    save(tmp_path, queue, "x = 1")
+    assert rendered.acquire(timeout=5)
+    assert queue._worker.is_alive()
+
+
+def test_failing_digest_does_not_stop_later_saves(tmp_path, monkeypatch):
+    digest = render_queue.source_digest
+
+    def failing_once(directory):
+        monkeypatch.setattr(render_queue, "source_digest", digest)
+        raise FileNotFoundError(directory)
+
+    monkeypatch.setattr(render_queue, "source_digest", failing_once)
+    queue, rendered = rendering(tmp_path, lambda: [{"scene": "Intro"}])
+    save(tmp_path, queue, "x = 1")
+    assert not rendered.acquire(timeout=0.5)
+
+    save(tmp_path, queue, "x = 2")
+    assert rendered.acquire(timeout=5)
+    assert queue._worker.is_alive()
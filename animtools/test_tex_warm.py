@@ -0,0 +1,44 @@
+import ast
+import types
+from pathlib import Path
+
+import numpy as np
+
+from animtools import tex_warm
+
+COLLISION = Path(__file__).resolve().parents[1] / "collision" / "scene.py"
+
+
+def calls(source, **namespace):
+    return [ast.unparse(node) for node in tex_warm._tex_calls(source, namespace)]
+
+
+def test_finds_calls_through_a_manim_alias():
+    source = """
+import manim as ma
+from manim import MathTex
+
+a = MathTex("x")
+b = ma.MathTex("F = ma").set_color(ma.BLUE)
+c = ma.Circle(1)
+d = ma.MathTex(str(1))
+e = np.Title("y")
+"""
+    manim = types.ModuleType("manim")
+    tex_mobject = types.ModuleType("manim.mobject.text.tex_mobject")
+    expected = {"MathTex('x')", "ma.MathTex('F = ma')"}
+    assert set(calls(source, ma=manim, np=np)) == expected
+    assert set(calls(source, ma=tex_mobject, np=np)) == expected
+    # Only attributes of manim modules count
+    assert calls(source, ma=np, np=np) == ["MathTex('x')"]
+    assert calls(source) == ["MathTex('x')"]
+
+
+def test_collision_scene_tex_is_found():
+    source = COLLISION.read_text()
+    found = calls(source, ma=types.ModuleType("manim"))
+    assert len(found) == len(calls(source)) + 7
+    assert "ma.Title('خطة محاكاة التصادم')" in found
+    assert any(call.startswith("ma.BulletedList('معادلات الحركة'") for call in found)
+    for expression in ("F = ma", "1", "2", "3"):
+        assert f"ma.MathTex('{expression}')" in found
@@ -0,0 +1,315 @@
+"""
+Compile many TeX expressions in one compiler run.
+
+With the xelatex + polyglossia + fontspec template of `QM/pt1`, starting the
+compiler costs far more than typesetting one formula, and manim starts it
+once per distinct `MathTex`/`Tex` string. Here every expression is put on
+its own page of one `standalone` document (multi-page mode), compiled once,
+and the pages are split into the SVG files manim's TeX cache expects, so
+`tex_to_svg_file` finds them already there. Batches start from a
+precompiled preamble format (see `tex_format`) when one can be built.
+
+Once installed, the expressions a render asks for are remembered in a
+manifest in the TeX directory. On the first cache miss, every known
+expression that is not cached yet is compiled in the same batch, so after
+an edit that touches many formulas there is still only one compiler start.
+
+Every SVG produced is also stored in the shared `tex_cache`, and checked
+for there before compiling.
+
+A batch that does not compile is bisected until the expressions at fault
+are found; those are dropped from the manifest, so a typo saved during live
+editing does not fail every later batch.
+
+Counters per render: "compiler runs", "batched" (SVGs produced), "failed
+batches" and "failed expressions".
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from animtools import stats, tex_cache, tex_format
+
+MANIFEST = "batch_manifest.json"
+
+# Expressions remembered per template
+MAX_ENTRIES = 2000
+
+PAGE_ENV = "animpage"
+
+
+def template_key(tex_template):
+    """Hash of everything in a template that changes the output."""
+    digest = hashlib.sha1()
+    for part in (
+        tex_template.body,
+        tex_template.tex_compiler,
+        tex_template.output_format,
+    ):
+        digest.update(part.encode())
+    return digest.hexdigest()[:16]
+
+
+def _texcode(tex_template, expression, environment):
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def _document(tex_template, items):
+    """A multi-page standalone document, one page per (expression, env)."""
+    pages = []
+    for expression, environment in items:
+        code = _texcode(tex_template, expression, environment)
+        head, rest = code.split(r"\begin{document}", 1)
+        body = rest.rsplit(r"\end{document}", 1)[0]
+        pages.append(f"\\begin{{{PAGE_ENV}}}{body}\\end{{{PAGE_ENV}}}")
+
+    # Every page shares the template's preamble
+    head, found = re.subn(
+        r"\\documentclass\[([^\]]*)\]\{standalone\}",
+        lambda match: f"\\documentclass[{match.group(1)},multi]{{standalone}}",
+        head,
+        count=1,
+    )
+    if not found:
+        return None
+    return (
+        head
+        + f"\\newenvironment{{{PAGE_ENV}}}{{}}{{}}\n"
+        + f"\\standaloneenv{{{PAGE_ENV}}}\n"
+        + "\\begin{document}\n"
+        + "\n".join(pages)
+        + "\n\\end{document}\n"
+    )
+
+
+def compile_command(tex_template, tex_file, output_dir, fmt=None):
+    """Command line compiling `tex_file` into `output_dir` like manim does."""
+    compiler = tex_template.tex_compiler
+    output_format = tex_template.output_format
+    command = [
+        compiler,
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-output-directory={output_dir}",
+    ]
+    if fmt is not None:
+        command.append(f"-fmt={fmt.stem}")
+    if compiler == "xelatex":
+        if output_format == ".xdv":
+            command.append("-no-pdf")
+    else:
+        command.append(f"-output-format={output_format[1:]}")
+    return [*command, str(tex_file)]
+
+
+def _compile(tex_template, tex_file, output_dir, fmt=None):
+    stats.bump("tex", "compiler runs")
+    compiled = subprocess.run(
+        compile_command(tex_template, tex_file, output_dir, fmt),
+        env=tex_format.environment(fmt) if fmt is not None else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    output = tex_file.with_suffix(tex_template.output_format)
+    return compiled.returncode == 0 and output.exists()
+
+
+def _compile_pages(tex_template, targets):
+    """
+    Compile `targets` (svg_file -> (tex_file, expression, environment)) as
+    the pages of one document. Returns the number of SVGs produced (0 if the
+    template cannot be batched), or None if the document did not compile.
+    """
+    from manim import config
+
+    document = _document(tex_template, [item[1:] for item in targets.values()])
+    if document is None:
+        return 0
+    document, fmt = tex_format.prepare(document, tex_template.tex_compiler)
+
+    # Private work directory: other renders may batch at the same time
+    work = Path(tempfile.mkdtemp(prefix="batch-", dir=config.get_dir("tex_dir")))
+    try:
+        tex_file = work / "batch.tex"
+        tex_file.write_text(document, encoding="utf-8")
+        output = tex_file.with_suffix(tex_template.output_format)
+        compiled = fmt is not None and _compile(tex_template, tex_file, work, fmt)
+        if not compiled:
+            compiled = _compile(tex_template, tex_file, work)
+            if compiled and fmt is not None:
+                # Fine without the format, so the format is at fault
+                tex_format.discard(fmt)
+        if not compiled:
+            stats.bump("tex", "failed batches")
+            return None
+
+        command = ["dvisvgm", "--page=1-", "-n", "-v", "0", "-o", str(work / "%p.svg")]
+        if tex_template.output_format == ".pdf":
+            command.insert(1, "--pdf")
+        subprocess.run(
+            [*command, str(output)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        # dvisvgm may zero-pad %p, so go by the number it wrote
+        pages = {int(page.stem): page for page in work.glob("*.svg")}
+        done = 0
+        for number, (svg_file, (tex_file, *_)) in enumerate(targets.items(), 1):
+            if number in pages:
+                os.replace(pages[number], svg_file)
+                tex_cache.store(tex_template, tex_file, svg_file)
+                done += 1
+        stats.bump("tex", "batched", done)
+        return done
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def _bisect(tex_template, targets):
+    """
+    Compile `targets`, splitting the batch in halves until the expressions
+    that do not compile are isolated. Returns those expressions.
+    """
+    if _compile_pages(tex_template, targets) is not None:
+        return []
+    if len(targets) == 1:
+        ((_, expression, environment),) = targets.values()
+        return [(expression, environment)]
+
+    items = list(targets.items())
+    half = len(items) // 2
+    return _bisect(tex_template, dict(items[:half])) + _bisect(
+        tex_template, dict(items[half:])
+    )
+
+
+def compile_batch(items, tex_template=None):
+    """
+    Make sure the SVG of every (expression, environment) in `items` exists.
+
+    When the batch does not compile, it is split in halves, and those again,
+    so one expression with a TeX error (say, a typo saved while editing)
+    costs a few more compiler runs instead of failing every other one.
+
+    Parameters:
+    -----------
+    items : iterable
+        (expression, environment) pairs as passed to `tex_to_svg_file`
+    tex_template : TexTemplate
+        Defaults to `config.tex_template`
+
+    Returns:
+    --------
+    list
+        The (expression, environment) pairs that did not compile; the
+        caller compiles those alone to get manim's error report
+    """
+    from manim import config
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    tex_template = tex_template or config.tex_template
+    targets = {}
+    for expression, environment in items:
+        tex_file = generate_tex_file(expression, environment, tex_template)
+        svg_file = tex_file.with_suffix(".svg")
+        if svg_file.exists() or svg_file in targets:
+            continue
+        if not tex_cache.fetch(tex_template, tex_file, svg_file):
+            targets[svg_file] = (tex_file, expression, environment)
+    if not targets:
+        return []
+
+    failed = _bisect(tex_template, targets)
+    stats.bump("tex", "failed expressions", len(failed))
+    return failed
+
+
+class _Manifest:
+    """Expressions seen per template, persisted in the TeX directory."""
+
+    def __init__(self):
+        self.entries = None
+
+    def _path(self):
+        from manim import config
+
+        return Path(config.get_dir("tex_dir")) / MANIFEST
+
+    def _load(self):
+        try:
+            data = json.loads(self._path().read_text())
+        except (OSError, ValueError):
+            data = {}
+        self.entries = {
+            key: {tuple(item): None for item in items} for key, items in data.items()
+        }
+
+    def add(self, key, item):
+        """Remember `item`; returns every item known for `key`."""
+        if self.entries is None:
+            self._load()
+        items = self.entries.setdefault(key, {})
+        if item not in items:
+            items[item] = None
+            while len(items) > MAX_ENTRIES:
+                del items[next(iter(items))]
+            self._save()
+        return list(items)
+
+    def discard(self, key, items):
+        """Forget `items`, so later batches do not try them again."""
+        known = self.entries.get(key, {})
+        for item in items:
+            known.pop(item, None)
+        self._save()
+
+    def _save(self):
+        path = self._path()
+        tmp = path.with_name(f"{path.name}.{os.getpid()}")
+        data = {key: list(items) for key, items in self.entries.items()}
+        tmp.write_text(json.dumps(data))
+        tmp.replace(path)
+
+
+def install():
+    from manim import config
+    from manim.mobject.text import tex_mobject
+    from manim.utils import tex_file_writing
+
+    original = tex_file_writing.tex_to_svg_file
+    manifest = _Manifest()
+
+    def tex_to_svg_file(expression, environment=None, tex_template=None):
+        tex_template = tex_template or config.tex_template
+        key = template_key(tex_template)
+        known = manifest.add(key, (expression, environment))
+
+        tex_file = tex_file_writing.generate_tex_file(
+            expression, environment, tex_template
+        )
+        svg_file = tex_file.with_suffix(".svg")
+        if svg_file.exists():
+            return svg_file
+
+        failed = compile_batch(known, tex_template)
+        if failed:
+            manifest.discard(key, failed)
+        if svg_file.exists():
+            return svg_file
+
+        # It does not compile: alone, so manim reports the TeX error
+        svg_file = original(expression, environment, tex_template)
+        tex_cache.store(tex_template, tex_file, svg_file)
+        return svg_file
+
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
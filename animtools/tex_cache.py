@@ -0,0 +1,119 @@
+"""
+A user-level TeX cache shared by every project in the repo.
+
+Each project keeps its own `media/Tex`, and `make clean` in `collision`
+wipes it, so the same `E_2 - E_1` is compiled again per project and after
+every clean. Compiled SVGs are also stored under `~/.cache/anim/tex`
+(`$ANIM_CACHE_DIR`, or `$XDG_CACHE_HOME/anim`, if set), keyed by a hash of
+the full TeX source (template and expression) and the compiler, and copied
+back into a project's `media/Tex` on a miss there.
+
+Writes go through a temporary file and a rename, so parallel renders never
+see half an SVG. When the cache grows past `MAX_BYTES`, the least recently
+used entries (by mtime, refreshed on every hit) are evicted under a lock.
+The cache is only scanned for that on the first store of a process and when
+the size it tracks since then goes over the limit.
+
+Counters per render: "hits", "misses", "stored" and "evicted".
+"""
+
+import fcntl
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from animtools import stats
+
+MAX_BYTES = 256 * 1024 * 1024
+
+# Cache size at the last scan plus what this process stored since; None
+# until the first scan
+_size = None
+
+
+def cache_dir():
+    if "ANIM_CACHE_DIR" in os.environ:
+        base = Path(os.environ["ANIM_CACHE_DIR"])
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / "anim"
+    return base / "tex"
+
+
+def _entry(tex_template, tex_file):
+    digest = hashlib.sha1()
+    digest.update(f"{tex_template.tex_compiler}\n".encode())
+    digest.update(f"{tex_template.output_format}\n".encode())
+    digest.update(tex_file.read_bytes())
+    key = digest.hexdigest()
+    return cache_dir() / key[:2] / f"{key}.svg"
+
+
+def _copy(source, target):
+    """Copy via a temporary file next to `target`, then rename into place."""
+    tmp = target.with_name(f".{target.name}.{os.getpid()}")
+    shutil.copyfile(source, tmp)
+    os.replace(tmp, target)
+
+
+def fetch(tex_template, tex_file, svg_file):
+    """Copy the cached SVG for `tex_file` to `svg_file`; False on a miss."""
+    entry = _entry(tex_template, tex_file)
+    try:
+        _copy(entry, svg_file)
+        os.utime(entry)
+    except FileNotFoundError:
+        # Not cached, or evicted while we were copying it
+        stats.bump("tex cache", "misses")
+        return False
+    stats.bump("tex cache", "hits")
+    return True
+
+
+def store(tex_template, tex_file, svg_file):
+    """Add a freshly compiled SVG to the cache."""
+    global _size
+    entry = _entry(tex_template, tex_file)
+    if entry.exists():
+        return
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    _copy(svg_file, entry)
+    stats.bump("tex cache", "stored")
+
+    size = entry.stat().st_size
+    if _size is None or _size + size > MAX_BYTES:
+        evict()
+    else:
+        _size += size
+
+
+def evict(max_bytes=MAX_BYTES):
+    """Drop least recently used entries until the cache fits `max_bytes`."""
+    global _size
+    root = cache_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        entries = []
+        total = 0
+        for path in root.glob("*/*.svg"):
+            try:
+                info = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+            total += info.st_size
+        if total <= max_bytes:
+            _size = total
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            stats.bump("tex cache", "evicted")
+        _size = total
@@ -0,0 +1,209 @@
+"""
+Precompiled preamble formats for TeX templates.
+
+Every compile under the Arabic templates re-reads the whole preamble:
+`polyglossia`, `fontspec` and the Waseem font in `QM/pt1`, `arabtex`, `babel`
+and `kpfonts` in `collision`. With mylatexformat the preamble is dumped
+once into a format file (keyed by a hash of the preamble and compiler) and
+later compiles start from that format, skipping everything up to
+`\\endofdump` (or `\\begin{document}`).
+
+XeTeX cannot keep OpenType fonts in a format, so for xelatex the dump stops
+before the first font or language setup line (`fontspec`, `polyglossia`,
+`\\newfontfamily` and so on); those still run on every compile.
+
+A format that fails to build or to compile against is remembered as bad and
+the plain compile is used. Micro-benchmark, cold vs format compile of the
+literal expressions of a scene file:
+
+    python -m animtools.tex_format QM/pt1/scene.py
+"""
+
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from animtools import stats
+
+# Compiler -> (ini engine, base format)
+ENGINES = {
+    "latex": ("pdftex", "latex"),
+    "pdflatex": ("pdftex", "pdflatex"),
+    "xelatex": ("xetex", "xelatex"),
+}
+
+# Preamble lines that load fonts XeTeX cannot dump
+FONT_SETUP = re.compile(
+    r"^[ \t]*\\(usepackage(\[[^\]]*\])?\{(fontspec|polyglossia|unicode-math)\}"
+    r"|set(main|sans|mono|math|other)(font|language)"
+    r"|newfontfamily|newfontface|defaultfontfeatures|babelfont)",
+    re.MULTILINE,
+)
+
+# Lets the same document compile with and without the format
+PROVIDE_ENDOFDUMP = "\\providecommand{\\endofdump}{}\n"
+
+
+def _format_dir():
+    from manim import config
+
+    path = Path(config.get_dir("tex_dir")) / "formats"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _build(head, tex_compiler, target):
+    engine, base = ENGINES[tex_compiler]
+    with tempfile.TemporaryDirectory(prefix="format-", dir=target.parent) as work:
+        source = Path(work) / f"{target.stem}.tex"
+        source.write_text(
+            head + "\\begin{document}\n\\end{document}\n", encoding="utf-8"
+        )
+        built = subprocess.run(
+            [
+                engine,
+                "-ini",
+                "-interaction=batchmode",
+                "-halt-on-error",
+                f"-jobname={target.stem}",
+                f"-output-directory={work}",
+                f"&{base}",
+                "mylatexformat.ltx",
+                str(source),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        output = source.with_suffix(".fmt")
+        if built.returncode != 0 or not output.exists():
+            return False
+        os.replace(output, target)
+        return True
+
+
+def ensure(head, tex_compiler):
+    """Format file for the preamble `head`, built if needed, or None."""
+    if tex_compiler not in ENGINES:
+        return None
+
+    digest = hashlib.sha1(f"{tex_compiler}\n{head}".encode()).hexdigest()[:16]
+    directory = _format_dir()
+    fmt = directory / f"{digest}.fmt"
+    failed = fmt.with_suffix(".failed")
+
+    # Several render children may want the same format at once
+    with open(fmt.with_suffix(".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not fmt.exists() and not failed.exists():
+            start = time.perf_counter()
+            if _build(head, tex_compiler, fmt):
+                stats.bump("tex", "formats built")
+                stats.bump("tex", "format build s", time.perf_counter() - start)
+            else:
+                failed.touch()
+    return fmt if fmt.exists() else None
+
+
+def discard(fmt):
+    """Stop using a format that compiles fail against."""
+    fmt.with_suffix(".failed").touch()
+    fmt.unlink(missing_ok=True)
+
+
+def prepare(document, tex_compiler):
+    """
+    Mark where the dumpable preamble of `document` ends and get its format.
+
+    Returns:
+    --------
+    document : str
+        The document, with `\\endofdump` inserted if needed; it compiles the
+        same with or without the format
+    fmt : Path
+        The format file, or None
+    """
+    head, body = document.split("\\begin{document}", 1)
+    if "\\endofdump" not in head and tex_compiler == "xelatex":
+        match = FONT_SETUP.search(head)
+        if match:
+            head = f"{head[:match.start()]}\\endofdump\n{head[match.start():]}"
+    if "\\endofdump" in head and PROVIDE_ENDOFDUMP not in head:
+        head = PROVIDE_ENDOFDUMP + head
+    return f"{head}\\begin{{document}}{body}", ensure(head, tex_compiler)
+
+
+def environment(fmt):
+    """Environment for a compiler run that should find `fmt`."""
+    # Trailing separator: search the default format path too
+    return {**os.environ, "TEXFORMATS": f"{fmt.parent}{os.pathsep}"}
+
+
+def _benchmark(path, count=10):
+    from manim import config
+
+    from animtools import tex_batch, tex_warm
+    from animtools.daemon import _load_scene_module
+
+    os.chdir(path.parent)
+    sys.path.insert(0, str(path.parent))
+    module = _load_scene_module(path)
+    found = tex_warm.expressions(path.read_text(), vars(module))
+    samples = [item for item in found if item[2] is config.tex_template][:count]
+    if not samples:
+        print("no literal TeX expressions found")
+        return
+    tex_template = config.tex_template
+
+    documents = []
+    for expression, environment_name, _ in samples:
+        if environment_name is not None:
+            code = tex_template.get_texcode_for_expression_in_env(
+                expression, environment_name
+            )
+        else:
+            code = tex_template.get_texcode_for_expression(expression)
+        documents.append(code)
+
+    start = time.perf_counter()
+    prepared = [prepare(code, tex_template.tex_compiler) for code in documents]
+    print(f"format build: {time.perf_counter() - start:.2f}s")
+
+    work = Path(tempfile.mkdtemp(prefix="format-bench-"))
+    try:
+        for label, use_format in (("cold", False), ("format", True)):
+            times = []
+            for index, (document, fmt) in enumerate(prepared):
+                if use_format and fmt is None:
+                    print("format: not available for this template")
+                    break
+                tex_file = work / f"{label}-{index}.tex"
+                tex_file.write_text(document, encoding="utf-8")
+                command = tex_batch.compile_command(
+                    tex_template, tex_file, work, fmt if use_format else None
+                )
+                start = time.perf_counter()
+                subprocess.run(
+                    command,
+                    env=environment(fmt) if use_format else None,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+                times.append(time.perf_counter() - start)
+            if times:
+                print(
+                    f"{label}: {sum(times) / len(times):.3f}s per expression "
+                    f"({len(times)} expressions)"
+                )
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    _benchmark(Path(sys.argv[1]).resolve(), *map(int, sys.argv[2:3]))
@@ -0,0 +1,202 @@
+"""
+Warm the TeX cache before a render starts.
+
+A scene's first render stops at every new `MathTex`/`Tex` while the
+compiler runs. Most of them are literals in the source, so we can find
+them up front: parse the scene module, evaluate each TeX mobject call
+(`MathTex(...)`, or `ma.MathTex(...)` after `import manim as ma`) whose
+arguments are constants (or `_("...")` translations, or module-level names)
+in the module's namespace, and let manim build the exact expression and
+template it would compile, stopping it just before it does. The uncached
+expressions are then split over a few forked workers, each compiling its
+share as one `tex_batch` document.
+
+The render daemon runs this in each render child; a file lock makes
+parallel renders of the same file wait for one warming pass instead of
+compiling the same formulas twice. It can also be run by hand:
+
+    python -m animtools.tex_warm QM/pt1/scene.py
+"""
+
+import ast
+import fcntl
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+from animtools import stats, tex_batch
+
+# Mobjects whose constructors go through `tex_to_svg_file`
+TEX_CLASSES = {"MathTex", "Tex", "SingleStringMathTex", "Title", "BulletedList"}
+
+# Argument expressions that are safe to evaluate outside of construct()
+_STATIC_NODES = (
+    ast.Constant,
+    ast.Name,
+    ast.Attribute,
+    ast.Load,
+    ast.List,
+    ast.Tuple,
+    ast.Dict,
+    ast.UnaryOp,
+    ast.BinOp,
+    ast.operator,
+    ast.unaryop,
+    ast.keyword,
+)
+
+
+class _Collected(Exception):
+    pass
+
+
+def _is_static(node):
+    for sub in ast.walk(node):
+        if isinstance(sub, ast.Call):
+            # Only translations: _("...")
+            if not (
+                isinstance(sub.func, ast.Name)
+                and sub.func.id == "_"
+                and len(sub.args) == 1
+                and isinstance(sub.args[0], ast.Constant)
+            ):
+                return False
+        elif not isinstance(sub, _STATIC_NODES):
+            return False
+    return True
+
+
+def _is_tex_class(func, namespace):
+    """Whether a callee names one of `TEX_CLASSES`, bare or through manim."""
+    if isinstance(func, ast.Name):
+        return func.id in TEX_CLASSES
+    if (
+        isinstance(func, ast.Attribute)
+        and isinstance(func.value, ast.Name)
+        and func.attr in TEX_CLASSES
+    ):
+        # `ma.MathTex`, where the module's `ma` is manim or one of its modules
+        module = namespace.get(func.value.id)
+        return (
+            isinstance(module, types.ModuleType)
+            and module.__name__.split(".")[0] == "manim"
+        )
+    return False
+
+
+def _tex_calls(source, namespace):
+    for node in ast.walk(ast.parse(source)):
+        if (
+            isinstance(node, ast.Call)
+            and _is_tex_class(node.func, namespace)
+            and all(_is_static(arg) for arg in node.args)
+            and all(_is_static(kw.value) for kw in node.keywords)
+        ):
+            yield node
+
+
+def expressions(source, namespace):
+    """
+    The TeX a module's literal TeX mobjects will ask for.
+
+    Parameters:
+    -----------
+    source : str
+        Source of the scene module
+    namespace : dict
+        The executed module's namespace (for names, templates and `_`)
+
+    Returns:
+    --------
+    list
+        (expression, environment, tex_template) triples, in source order
+    """
+    from manim import config
+    from manim.mobject.text import tex_mobject
+
+    found = []
+
+    def record(expression, environment=None, tex_template=None):
+        found.append((expression, environment, tex_template or config.tex_template))
+        raise _Collected
+
+    original = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    try:
+        for node in _tex_calls(source, namespace):
+            code = compile(ast.Expression(node), "<tex_warm>", "eval")
+            try:
+                eval(code, namespace)
+            except Exception:
+                # _Collected once recorded; anything else means the call was
+                # not as static as it looked, and construct() will compile it
+                pass
+    finally:
+        tex_mobject.tex_to_svg_file = original
+    return found
+
+
+def _compile_in_workers(jobs):
+    """Run `compile_batch` for each (items, template) in its own child."""
+    children = []
+    for items, tex_template in jobs:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                tex_batch.compile_batch(items, tex_template)
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+        children.append(pid)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+
+def warm(source, namespace, workers=None):
+    """Compile every uncached literal TeX expression of a module."""
+    from manim import config
+    from manim.utils.tex_file_writing import generate_tex_file
+
+    start = time.perf_counter()
+    tex_dir = Path(config.get_dir("tex_dir"))
+    tex_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(tex_dir / ".warm.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+
+        groups = {}
+        for expression, environment, tex_template in expressions(source, namespace):
+            tex_file = generate_tex_file(expression, environment, tex_template)
+            if tex_file.with_suffix(".svg").exists():
+                continue
+            key = tex_batch.template_key(tex_template)
+            items = groups.setdefault(key, ([], tex_template))[0]
+            if (expression, environment) not in items:
+                items.append((expression, environment))
+        if not groups:
+            return
+
+        workers = workers or os.cpu_count()
+        jobs = []
+        for items, tex_template in groups.values():
+            count = min(workers, len(items))
+            jobs.extend((items[i::count], tex_template) for i in range(count))
+        _compile_in_workers(jobs)
+
+        stats.bump("tex", "warmed", sum(len(items) for items, _ in jobs))
+        stats.bump("tex", "warm s", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    from animtools.daemon import _load_scene_module
+
+    path = Path(sys.argv[1]).resolve()
+    os.chdir(path.parent)
+    sys.path.insert(0, str(path.parent))
+    module = _load_scene_module(path)
+    warm(path.read_text(), vars(module))
+    print(stats.format_snapshot(stats.snapshot()))
@@ -0,0 +1,101 @@
+"""
+Cache built `Text` mobjects.
+
+manim already keeps the SVG Pango writes for a `Text`, but every
+`Text(_("Emitter"), font=FONT)` still parses that SVG and builds the
+glyph outlines again, each run and each time the same label appears in a
+construct (the `f"{temp} K"` readouts, repeated titles). We keep the
+finished mobject: in memory for the rest of the render, and pickled in the
+text directory for later renders, keyed by everything that shapes it.
+
+The color is left out of the key when it is uniform: a hit is recolored
+with `set_color`. With `t2c`, `t2g` or `gradient` it is part of the key.
+
+Counters per render: "hits", "misses" and "saved s", the build time the
+hits did not spend.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+
+from animtools import stats
+
+_memo = {}
+
+
+def _uniform(kwargs):
+    """Whether the whole text gets one color, so it can be recolored."""
+    return not any(kwargs.get(name) for name in ("t2c", "t2g", "gradient"))
+
+
+def _key(text, args, kwargs):
+    kwargs = dict(kwargs)
+    if _uniform(kwargs):
+        kwargs.pop("color", None)
+    return repr((text, args, sorted(kwargs.items())))
+
+
+def _path(key):
+    import manim
+    from manim import config
+
+    digest = hashlib.sha1(f"{manim.__version__}\n{key}".encode()).hexdigest()
+    return Path(config.get_dir("text_dir")) / "mobjects" / f"{digest}.pkl"
+
+
+def _load(key):
+    try:
+        return pickle.loads(_path(key).read_bytes())
+    except Exception:
+        return None
+
+
+def _save(key, entry):
+    path = _path(key)
+    try:
+        data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Keep it in memory only
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def install():
+    from manim import VMobject
+    from manim.mobject.text.text_mobject import Text
+
+    original_init = Text.__init__
+
+    def __init__(self, text, *args, **kwargs):
+        # Subclasses may build more in their own __init__
+        if type(self) is not Text:
+            return original_init(self, text, *args, **kwargs)
+
+        start = time.perf_counter()
+        key = _key(text, args, kwargs)
+        color = kwargs.get("color")
+        entry = _memo.get(key) or _load(key)
+        if entry is None:
+            original_init(self, text, *args, **kwargs)
+            entry = (self.copy(), color, time.perf_counter() - start)
+            _memo[key] = entry
+            _save(key, entry)
+            stats.bump("text cache", "misses")
+            return
+
+        _memo[key] = entry
+        prototype, prototype_color, cost = entry
+        self.__dict__.update(prototype.copy().__dict__)
+        if _uniform(kwargs) and color != prototype_color:
+            # Same default as Text itself
+            self.set_color(color or VMobject().color)
+        stats.bump("text cache", "hits")
+        stats.bump("text cache", "saved s", cost - (time.perf_counter() - start))
+
+    Text.__init__ = __init__
@@ -0,0 +1,145 @@
+"""
+Watch a project directory and re-render the scenes a save affects.
+
+Renders go through `RenderDaemon`, so manim stays imported between saves and
+each run only pays for executing the scene module and rendering it. Events
+are funnelled through `RenderQueue`, which debounces them and cancels renders
+that a newer save made obsolete. `SceneGraph` diffs each save against the
+previous one so only scenes whose code (or helpers) changed are re-rendered,
+in parallel. The result goes to a single mpv window, which jumps to the
+first animation that changed. Translated scenes can be rendered once per
+locale in the same pass, sharing everything that does not depend on it.
+
+Every save first renders a low-quality draft for the preview; once it is
+shown, the same source revision is rendered again at high quality in the
+background (niced), and the player swaps to it when it is ready.
+"""
+
+import os
+import time
+
+import watchdog.events
+import watchdog.observers
+
+from animtools import stats
+from animtools.daemon import RenderDaemon
+from animtools.deps import SceneGraph
+from animtools.preview import MpvPreview
+from animtools.render_queue import RenderQueue
+
+
+def report(result, import_time):
+    if "error" in result:
+        print(f"[render] {result['scene']} failed:\n{result['error']}")
+        return False
+    if result.get("cancelled"):
+        print(f"[render] {result['scene']} cancelled")
+        return False
+
+    print(
+        f"[render] {result['scene']} ({result['quality']}): "
+        f"startup {result['startup']:.2f}s, render {result['render']:.2f}s "
+        f"(manim import {import_time:.2f}s, paid once by the daemon)"
+    )
+    if len(result.get("movies", ())) > 1:
+        for locale, movie in result["movies"].items():
+            print(f"[render] {result['scene']} [{locale}]: {movie}")
+    if result["stats"]:
+        print(stats.format_snapshot(result["stats"]))
+    return True
+
+
+class FileChangeHandler(watchdog.events.FileSystemEventHandler):
+    def __init__(self, queue):
+        self.queue = queue
+
+    def on_modified(self, event):
+        if event.src_path.endswith(".py"):
+            print(f"File {event.src_path} has been modified")
+            self.queue.notify()
+
+
+def main(
+    scene_file,
+    *scenes,
+    draft_quality="low_quality",
+    hq_quality="high_quality",
+    frame_workers=None,
+    locales=None,
+):
+    """
+    Watch the current directory and keep `scene_file` rendered. Only the
+    given `scenes` are rendered, or every Scene class in the file if none are;
+    the preview follows the first of them, or whichever draft finished last.
+    Pass `hq_quality=None` to skip the background high-quality pass, and
+    `frame_workers` to rasterize long `play()` calls on that many cores.
+    With `locales` (e.g. `("ar", "en")`) each render produces one movie per
+    locale, `<Scene>_<locale>`, and the preview shows the first.
+    """
+    daemon = RenderDaemon()
+    print(f"[render] daemon ready, manim imported in {daemon.import_time:.2f}s")
+
+    graph = SceneGraph(scene_file)
+
+    def make_jobs():
+        try:
+            affected = graph.update()
+        except SyntaxError as e:
+            print(f"[deps] {e}")
+            return []
+        affected = [s for s in affected if not scenes or s in scenes]
+        print(f"[deps] affected: {', '.join(affected) or 'none'}")
+
+        with open(scene_file) as f:
+            source = f.read()
+        return [
+            {
+                "file": os.path.abspath(scene_file),
+                "scene": scene,
+                "source": source,
+                "quality": draft_quality,
+                "frame_workers": frame_workers,
+                "locales": locales,
+            }
+            for scene in affected
+        ]
+
+    def follow_up(job):
+        if hq_quality is None or job["quality"] != draft_quality:
+            return None
+        return {**job, "quality": hq_quality, "nice": 19}
+
+    preview = MpvPreview()
+    drafts = {}  # scene -> movie of its latest draft
+
+    def on_result(result):
+        if not report(result, daemon.import_time):
+            return
+        if result["quality"] == draft_quality:
+            drafts[result["scene"]] = result["movie"]
+            if scenes and result["scene"] != scenes[0]:
+                return
+            preview.show(result["movie"], start=result["first_change"])
+        elif preview.current == drafts.get(result["scene"]):
+            # Still looking at this scene's draft: swap in place
+            preview.show(result["movie"], start=preview.position())
+
+    queue = RenderQueue(daemon, make_jobs, on_result, follow_up=follow_up)
+
+    # Initial run
+    queue.notify()
+
+    # Set up file watcher
+    event_handler = FileChangeHandler(queue)
+    observer = watchdog.observers.Observer()
+    observer.schedule(event_handler, path=".", recursive=False)
+    observer.start()
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        observer.stop()
+    observer.join()
+    daemon.close()
+    preview.close()